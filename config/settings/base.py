@@ -68,6 +68,7 @@ DJANGO_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -290,6 +291,12 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(hour=5, minute=0, day_of_month="1,6,11,16,21,26"),
         "options": {"expires": 3600},
     },
+    # Article pages: re-render stored HTML left behind by a RENDER_VERSION bump.
+    "rerender-stale-article-pages": {
+        "task": "tech_articles.content.tasks.rerender_stale_article_pages",
+        "schedule": crontab(minute=15),
+        "options": {"expires": 3600},
+    },
 }
 
 # Timezone used for newsletter scheduling (Montréal / Eastern Time)
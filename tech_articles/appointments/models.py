@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator
@@ -11,6 +12,12 @@ from tech_articles.common.models import UUIDModel, TimeStampedModel
 from tech_articles.utils.enums import WeekdayChoices, AppointmentStatus, PaymentStatus, PaymentProvider
 
 
+@lru_cache(maxsize=128)
+def parse_durations(value: str) -> tuple[int, ...]:
+    """Parse a comma-separated durations string into a tuple of minutes."""
+    return tuple(int(d.strip()) for d in value.split(",") if d.strip().isdigit())
+
+
 class AppointmentSettings(models.Model):
     """Singleton model for global appointment configuration."""
     timezone = models.CharField(
@@ -37,6 +44,19 @@ class AppointmentSettings(models.Model):
         obj, _ = cls.objects.get_or_create(pk=1, defaults={"timezone": "UTC"})
         return obj
 
+    @classmethod
+    def lock_for_booking(cls):
+        """
+        Lock the settings row for the current transaction.
+
+        Payment confirmation checks for an overlapping confirmed booking and
+        then confirms its own; locks on existing slot rows cannot stop another
+        slot being confirmed concurrently, so confirmations serialize on this
+        singleton row instead.
+        """
+        cls.get_settings()
+        return cls.objects.select_for_update().get(pk=1)
+
 
 
 class AppointmentType(UUIDModel, TimeStampedModel):
@@ -95,6 +115,15 @@ class AppointmentType(UUIDModel, TimeStampedModel):
     def __str__(self) -> str:
         return self.name
 
+    @property
+    def durations_list(self) -> tuple[int, ...]:
+        """Allowed durations in minutes, parsed once per distinct value."""
+        return parse_durations(self.allowed_durations_minutes or "")
+
+    def get_total_amount(self, duration_minutes: int) -> Decimal:
+        """Price of a booking of ``duration_minutes`` at the base hourly rate."""
+        return (self.base_hourly_rate * duration_minutes / 60).quantize(Decimal("0.01"))
+
 
 class AvailabilityRule(UUIDModel, TimeStampedModel):
     weekday = models.CharField(
@@ -164,6 +193,23 @@ class AppointmentSlot(UUIDModel, TimeStampedModel):
     def __str__(self) -> str:
         return f"{self.start_at} -> {self.end_at}"
 
+    @classmethod
+    def has_confirmed_overlap(cls, start_at, end_at, exclude_pk=None) -> bool:
+        """Whether a paid or free-accepted booking overlaps ``start_at``-``end_at``."""
+        return (
+            cls.objects.filter(
+                is_booked=True,
+                appointment__payment_status__in=[
+                    PaymentStatus.SUCCEEDED,
+                    PaymentStatus.FREE_ACCEPTED,
+                ],
+                start_at__lt=end_at,
+                end_at__gt=start_at,
+            )
+            .exclude(pk=exclude_pk)
+            .exists()
+        )
+
 
 class Appointment(UUIDModel, TimeStampedModel):
     user = models.ForeignKey(
@@ -280,10 +326,13 @@ class Appointment(UUIDModel, TimeStampedModel):
             models.Index(fields=["user", "status", "payment_status"]),
         ]
 
-    def confirm(self) -> None:
+    def confirm(self, update_fields: list[str] | None = None) -> None:
+        """Mark as confirmed, writing any other pending ``update_fields`` in the same UPDATE."""
         self.status = AppointmentStatus.CONFIRMED
         self.confirmed_at = timezone.now()
-        self.save(update_fields=["status", "confirmed_at"])
+        self.save(
+            update_fields=["status", "confirmed_at", "updated_at", *(update_fields or [])]
+        )
 
     def __str__(self) -> str:
         return f"{self.user_id} - {self.appointment_type.name} ({self.status})"
@@ -66,13 +66,15 @@ class UpdateMeetingLinkApiView(LoginRequiredMixin, AdminRequiredMixin, View):
                 return JsonResponse({"status": "error", "message": _("Meeting link is required.")}, status=400)
 
             appointment.meeting_link = meeting_link
+            update_fields = ["meeting_link", "updated_at"]
 
             # If status was link_pending, move to confirmed
             if appointment.status == AppointmentStatus.LINK_PENDING:
                 appointment.status = AppointmentStatus.CONFIRMED
                 appointment.confirmed_at = timezone.now()
+                update_fields += ["status", "confirmed_at"]
 
-            appointment.save()
+            appointment.save(update_fields=update_fields)
 
             # Trigger notification to user
             from tech_articles.appointments.tasks.appointment_tasks import send_appointment_link_notification
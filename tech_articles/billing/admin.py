@@ -269,9 +269,10 @@ class PaymentTransactionAdmin(admin.ModelAdmin):
         "currency",
         "status",
         "provider_payment_id",
+        "needs_refund",
         "created_at",
     ]
-    list_filter = ["provider", "kind", "status"]
+    list_filter = ["provider", "kind", "status", "needs_refund"]
     search_fields = [
         "provider_payment_id",
         "provider_subscription_id",
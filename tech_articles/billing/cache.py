@@ -8,13 +8,14 @@ with automatic cache invalidation.
 from django.core.cache import cache
 from django.utils import timezone
 
-from tech_articles.billing.models import Purchase, Subscription
+from tech_articles.billing.models import Plan, Purchase, Subscription
 from tech_articles.utils.enums import PaymentStatus
 
 
 # Cache keys
 SUBSCRIPTION_CACHE_KEY_PREFIX = "user_subscription_{user_id}"
 PURCHASED_ARTICLES_CACHE_KEY_PREFIX = "user_purchased_articles_{user_id}"
+ACTIVE_PLANS_CACHE_KEY = "active_plans"
 CACHE_TIMEOUT = 3600  # 1 hour
 
 
@@ -97,6 +98,30 @@ class BillingCache:
 
         return purchased_ids
 
+    @staticmethod
+    def get_active_plans():
+        """
+        Get active plans with their features from cache, or query from DB if not cached.
+
+        Returns:
+            List of Plan instances with plan_features prefetched
+        """
+        cached = cache.get(ACTIVE_PLANS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        plans = list(
+            Plan.objects.filter(is_active=True).prefetch_related("plan_features")
+        )
+        cache.set(ACTIVE_PLANS_CACHE_KEY, plans, CACHE_TIMEOUT)
+
+        return plans
+
+    @staticmethod
+    def clear_active_plans_cache():
+        """Clear the cached list of active plans."""
+        cache.delete(ACTIVE_PLANS_CACHE_KEY)
+
     @staticmethod
     def clear_subscription_cache(user):
         """
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("billing", "0007_add_appointment_fk_to_paymenttransaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paymenttransaction",
+            name="needs_refund",
+            field=models.BooleanField(
+                default=False,
+                help_text="Paid for an appointment slot that was already taken; refund the customer",
+                verbose_name="needs refund",
+            ),
+        ),
+    ]
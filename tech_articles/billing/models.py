@@ -577,6 +577,11 @@ class PaymentTransaction(UUIDModel, TimeStampedModel):
         default=False,
         help_text=_("Whether this transaction was processed from a webhook"),
     )
+    needs_refund = models.BooleanField(
+        _("needs refund"),
+        default=False,
+        help_text=_("Paid for an appointment slot that was already taken; refund the customer"),
+    )
 
     error_message = models.TextField(
         _("error message"),
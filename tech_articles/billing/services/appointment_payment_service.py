@@ -8,7 +8,9 @@ import uuid
 import logging
 from decimal import Decimal
 
+from django.core.mail import mail_admins
 from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from tech_articles.billing.models import PaymentTransaction
@@ -91,18 +93,29 @@ class AppointmentPaymentService:
         payment_txn: PaymentTransaction,
         provider_payment_id: str = "",
         raw: dict | None = None,
-    ) -> None:
+    ) -> bool:
         """
         Mark the transaction as succeeded, set appointment payment_status to
         succeeded, and call appointment.confirm() to set confirmed status/timestamp.
 
+        Pending bookings do not hold their time range, so if another booking
+        overlapping this one was confirmed first, the appointment is cancelled
+        and its slot released instead; the payment is left succeeded, flagged
+        ``needs_refund`` and reported to the site admins.
+
         Idempotent: if the transaction is already succeeded, this is a no-op.
+
+        Returns True if the appointment is confirmed, False if it could not be
+        (slot already taken, or no linked appointment).
         """
+        from tech_articles.appointments.models import AppointmentSettings, AppointmentSlot
+        from tech_articles.utils.enums import AppointmentStatus
+
         if payment_txn.status == PaymentStatus.SUCCEEDED:
             logger.info(
                 "Appointment payment %s already confirmed — skipping.", payment_txn.id
             )
-            return
+            return not payment_txn.needs_refund
 
         payment_txn.mark_succeeded(provider_payment_id=provider_payment_id, raw=raw)
 
@@ -112,17 +125,48 @@ class AppointmentPaymentService:
                 "PaymentTransaction %s has no linked appointment — cannot confirm.",
                 payment_txn.id,
             )
-            return
+            return False
 
         appointment.payment_status = PaymentStatus.SUCCEEDED
         if provider_payment_id:
             appointment.provider_payment_id = provider_payment_id
-        appointment.save(
-            update_fields=["payment_status", "provider_payment_id", "updated_at"]
-        )
 
-        # Confirm the appointment (sets status=CONFIRMED and confirmed_at)
-        appointment.confirm()
+        # Confirmations serialize here so two overlapping bookings cannot both
+        # pass the overlap check before either is confirmed
+        AppointmentSettings.lock_for_booking()
+        slot = appointment.slot
+        if AppointmentSlot.has_confirmed_overlap(slot.start_at, slot.end_at, exclude_pk=slot.pk):
+            appointment.status = AppointmentStatus.CANCELLED
+            appointment.cancelled_at = timezone.now()
+            appointment.save(
+                update_fields=[
+                    "status",
+                    "cancelled_at",
+                    "payment_status",
+                    "provider_payment_id",
+                    "updated_at",
+                ]
+            )
+            slot.is_booked = False
+            slot.save(update_fields=["is_booked", "updated_at"])
+            payment_txn.needs_refund = True
+            payment_txn.save(update_fields=["needs_refund", "updated_at"])
+
+            message = (
+                f"Appointment {appointment.id} overlaps a booking confirmed first and "
+                f"was cancelled. Payment {payment_txn.id} ({payment_txn.provider}, "
+                f"provider_payment_id: {provider_payment_id or '-'}, "
+                f"{payment_txn.amount} {payment_txn.currency}) needs a refund."
+            )
+            logger.error(message)
+            transaction.on_commit(
+                lambda: mail_admins("Appointment payment needs a refund", message, fail_silently=True)
+            )
+            return False
+
+        # Confirm the appointment (sets status=CONFIRMED and confirmed_at) and
+        # persist the payment fields in the same UPDATE
+        appointment.confirm(update_fields=["payment_status", "provider_payment_id"])
 
         logger.info(
             "Confirmed appointment payment %s and appointment %s (provider_payment_id: %s)",
@@ -150,6 +194,8 @@ class AppointmentPaymentService:
         except Exception:
             logger.exception("Failed to create APPOINTMENT_BOOKED event")
 
+        return True
+
     @staticmethod
     @transaction.atomic
     def fail_payment(
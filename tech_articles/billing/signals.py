@@ -5,7 +5,7 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver, Signal
 from django.utils.translation import gettext_lazy as _
 
-from tech_articles.billing.models import Subscription, Purchase
+from tech_articles.billing.models import Plan, PlanFeature, Subscription, Purchase
 from tech_articles.utils.enums import PaymentStatus
 
 # Custom signals
@@ -57,3 +57,12 @@ def invalidate_purchase_cache_on_delete(sender, instance, **kwargs):
     from tech_articles.billing.cache import BillingCache
     BillingCache.clear_purchased_articles_cache(instance.user)
 
+
+@receiver(post_save, sender=Plan)
+@receiver(post_delete, sender=Plan)
+@receiver(post_save, sender=PlanFeature)
+@receiver(post_delete, sender=PlanFeature)
+def invalidate_active_plans_cache(sender, instance, **kwargs):
+    """Clear the active plans cache when a plan or one of its features changes."""
+    from tech_articles.billing.cache import BillingCache
+    BillingCache.clear_active_plans_cache()
@@ -2,10 +2,12 @@
 Tests for billing admin views (transactions, subscriptions).
 """
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase, Client
 from django.urls import reverse
 
-from tech_articles.billing.models import PaymentTransaction, Plan, Subscription
+from tech_articles.billing.cache import BillingCache
+from tech_articles.billing.models import PaymentTransaction, Plan, PlanFeature, Subscription
 from tech_articles.utils.enums import PaymentProvider, PaymentStatus, PlanInterval, CurrencyChoices
 
 User = get_user_model()
@@ -154,3 +156,37 @@ class SubscriptionListViewTestCase(_AdminSetupMixin, TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["subscription"], sub)
+
+
+class ActivePlansCacheTestCase(TestCase):
+    """Tests for the cached list of active plans shown on the home page."""
+
+    def setUp(self):
+        cache.clear()
+        self.plan = Plan.objects.create(
+            name="Cached Pro",
+            price="9.99",
+            currency=CurrencyChoices.USD,
+            interval=PlanInterval.MONTH,
+            provider=PaymentProvider.STRIPE,
+        )
+        PlanFeature.objects.create(plan=self.plan, name="Unlimited articles")
+
+    def test_second_call_served_from_cache(self):
+        BillingCache.get_active_plans()
+        with self.assertNumQueries(0):
+            plans = BillingCache.get_active_plans()
+            features = [f.name for f in plans[0].plan_features.all()]
+        self.assertEqual(features, ["Unlimited articles"])
+
+    def test_feature_change_clears_cache(self):
+        BillingCache.get_active_plans()
+        PlanFeature.objects.create(plan=self.plan, name="Priority support")
+        plans = BillingCache.get_active_plans()
+        self.assertEqual(len(plans[0].plan_features.all()), 2)
+
+    def test_deactivated_plan_dropped(self):
+        BillingCache.get_active_plans()
+        self.plan.is_active = False
+        self.plan.save()
+        self.assertEqual(BillingCache.get_active_plans(), [])
@@ -13,6 +13,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
+from django.core import mail
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.utils import timezone
@@ -133,6 +134,35 @@ class AppointmentPaymentServiceTestCase(TestCase):
         txn.refresh_from_db()
         self.assertEqual(txn.status, PaymentStatus.SUCCEEDED)
 
+    def test_confirm_payment_cancels_booking_overlapping_a_confirmed_one(self):
+        """The second of two overlapping bookings to be paid is cancelled and its slot released."""
+        other = _make_appointment(_make_user())
+        first = AppointmentPaymentService.initiate_payment(
+            appointment=other,
+            provider=PaymentProvider.STRIPE,
+        )
+        second = AppointmentPaymentService.initiate_payment(
+            appointment=self.appointment,
+            provider=PaymentProvider.STRIPE,
+        )
+        AppointmentSlot.objects.update(is_booked=True)
+        self.assertTrue(AppointmentPaymentService.confirm_payment(first, provider_payment_id="pi_first"))
+        self.assertFalse(AppointmentPaymentService.confirm_payment(second, provider_payment_id="pi_second"))
+
+        second.refresh_from_db()
+        self.assertEqual(second.status, PaymentStatus.SUCCEEDED)
+        self.assertTrue(second.needs_refund)
+
+        other.refresh_from_db()
+        self.appointment.refresh_from_db()
+        self.appointment.slot.refresh_from_db()
+
+        self.assertEqual(other.status, AppointmentStatus.CONFIRMED)
+        self.assertEqual(self.appointment.status, AppointmentStatus.CANCELLED)
+        self.assertIsNotNone(self.appointment.cancelled_at)
+        self.assertEqual(self.appointment.provider_payment_id, "pi_second")
+        self.assertFalse(self.appointment.slot.is_booked)
+
     def test_fail_payment_marks_transaction_failed_and_leaves_appointment_unconfirmed(self):
         """fail_payment should mark transaction as failed; appointment stays unconfirmed."""
         txn = AppointmentPaymentService.initiate_payment(
@@ -273,6 +303,67 @@ class AppointmentPaymentCreateViewTestCase(TestCase):
         self.assertIn("approval_url", data)
 
 
+# ============================================================================
+# AppointmentPaymentSuccessView
+# ============================================================================
+
+
+class AppointmentPaymentSuccessViewTestCase(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = _make_user()
+        self.client.login(email=self.user.email, password="pass")
+        self.appointment = _make_appointment(self.user)
+        self.payment_txn = AppointmentPaymentService.initiate_payment(
+            appointment=self.appointment,
+            provider=PaymentProvider.STRIPE,
+        )
+        self.url = reverse(
+            "billing:appointment_payment_success",
+            kwargs={"transaction_id": self.payment_txn.id},
+        )
+
+    @patch("tech_articles.billing.views.appointment_payment_views.StripeService.retrieve_checkout_session")
+    def test_stripe_return_confirms_appointment(self, mock_retrieve):
+        """A completed Stripe session confirms the appointment on return."""
+        mock_retrieve.return_value = {"id": "cs_test_ok"}
+        response = self.client.get(self.url, {"session_id": "cs_test_ok"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Appointment Confirmed!")
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, AppointmentStatus.CONFIRMED)
+
+    @patch("tech_articles.billing.views.appointment_payment_views.StripeService.retrieve_checkout_session")
+    def test_stripe_return_for_taken_slot_shows_pending_refund(self, mock_retrieve):
+        """A paid booking that lost its slot is shown as cancelled, flagged and reported to admins."""
+        other = _make_appointment(_make_user())
+        other_txn = AppointmentPaymentService.initiate_payment(
+            appointment=other,
+            provider=PaymentProvider.STRIPE,
+        )
+        AppointmentSlot.objects.update(is_booked=True)
+        AppointmentPaymentService.confirm_payment(other_txn, provider_payment_id="pi_other")
+
+        mock_retrieve.return_value = {"id": "cs_test_late"}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(self.url, {"session_id": "cs_test_late"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Appointment Confirmed!")
+        self.assertContains(response, "Slot No Longer Available")
+        self.assertContains(response, "Your refund is pending")
+
+        self.appointment.refresh_from_db()
+        self.payment_txn.refresh_from_db()
+        self.assertEqual(self.appointment.status, AppointmentStatus.CANCELLED)
+        self.assertEqual(self.payment_txn.status, PaymentStatus.SUCCEEDED)
+        self.assertTrue(self.payment_txn.needs_refund)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(str(self.payment_txn.id), mail.outbox[0].body)
+
+
 # ============================================================================
 # Stripe Webhook — Appointment Payment
 # ============================================================================
@@ -126,6 +126,8 @@ class AppointmentPaymentSuccessView(LoginRequiredMixin, TemplateView):
     GET /billing/appointments/success/<transaction_id>/
     Success page shown after a confirmed appointment payment.
     Also handles Stripe return (session_id query param) for immediate confirmation.
+    If the slot was taken by a booking confirmed first, the page shows the
+    cancellation and pending refund instead.
     """
 
     template_name = "tech-articles/home/pages/billing/appointment_payment_success.html"
@@ -143,13 +145,18 @@ class AppointmentPaymentSuccessView(LoginRequiredMixin, TemplateView):
             try:
                 session = StripeService.retrieve_checkout_session(session_id)
                 if not payment_txn.webhook_processed:
-                    AppointmentPaymentService.confirm_payment(
+                    confirmed = AppointmentPaymentService.confirm_payment(
                         payment_txn=payment_txn,
                         provider_payment_id=session_id,
                         raw=session if isinstance(session, dict) else dict(session),
                     )
                     payment_txn.webhook_processed = True
                     payment_txn.save(update_fields=["webhook_processed", "updated_at"])
+                    if not confirmed:
+                        messages.warning(
+                            request,
+                            _("This time slot was booked by someone else. Your payment will be refunded."),
+                        )
             except Exception as exc:
                 logger.warning("Stripe appointment success callback error: %s", exc)
 
@@ -180,13 +187,18 @@ class AppointmentPaymentPayPalReturnView(LoginRequiredMixin, View):
                 capture_status = capture_data.get("status", "")
                 if capture_status == "COMPLETED":
                     if not payment_txn.webhook_processed:
-                        AppointmentPaymentService.confirm_payment(
+                        confirmed = AppointmentPaymentService.confirm_payment(
                             payment_txn=payment_txn,
                             provider_payment_id=payment_txn.provider_payment_id,
                             raw=capture_data,
                         )
                         payment_txn.webhook_processed = True
                         payment_txn.save(update_fields=["webhook_processed", "updated_at"])
+                        if not confirmed:
+                            messages.warning(
+                                request,
+                                _("This time slot was booked by someone else. Your payment will be refunded."),
+                            )
                     return redirect(
                         "billing:appointment_payment_success",
                         transaction_id=payment_txn.id,
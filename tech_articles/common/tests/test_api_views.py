@@ -1,13 +1,18 @@
 import json
 import logging
+from datetime import timedelta
+from unittest import mock
 
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 
 from tech_articles.content.models import Article, Category, FeaturedArticles
+from tech_articles.content.views.article_public_views import ArticlesApiView
 from tech_articles.utils.constants import FEATURED_ARTICLES_UUID
+from tech_articles.utils.db_functions import DbFunctions
 from tech_articles.utils.enums import ArticleStatus, LanguageChoices
 
 logger = logging.getLogger(__name__)
@@ -143,6 +148,269 @@ class ArticlesApiViewTest(TestCase):
         self.assertEqual(data['pagination']['total_count'], 0)
 
 
+class ArticlesApiKeysetPaginationTest(TestCase):
+    """Test cases for cursor-based pagination on the articles API."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.author = User.objects.create_user(
+            email='keyset@example.com',
+            password='testpass123',
+        )
+        now = timezone.now()
+        for i in range(8):
+            Article.objects.create(
+                title=f'Keyset {i + 1}',
+                author=self.author,
+                status=ArticleStatus.PUBLISHED,
+                language=LanguageChoices.EN,
+                published_at=now - timedelta(hours=i),
+            )
+
+    def test_cursor_returns_next_page(self):
+        first = json.loads(self.client.get(reverse('content:api_articles')).content)
+        cursor = first['pagination']['next_cursor']
+        self.assertIsNotNone(cursor)
+
+        second = json.loads(
+            self.client.get(
+                reverse('content:api_articles'), {'page': 2, 'cursor': cursor},
+            ).content
+        )
+        titles = [a['title'] for a in second['articles']]
+        self.assertEqual(titles, ['Keyset 7', 'Keyset 8'])
+        self.assertFalse(second['pagination']['has_next'])
+        self.assertIsNone(second['pagination']['next_cursor'])
+
+    def test_popular_deep_page_keeps_order(self):
+        for i, article in enumerate(Article.objects.order_by('title')):
+            Article.objects.filter(pk=article.pk).update(reading_time_minutes=i + 1)
+        data = json.loads(
+            self.client.get(reverse('content:api_articles'), {'sort': 'popular', 'page': 2}).content
+        )
+        self.assertEqual([a['title'] for a in data['articles']], ['Keyset 2', 'Keyset 1'])
+        self.assertFalse(data['pagination']['has_next'])
+
+    def test_cursor_matches_offset_page(self):
+        first = json.loads(
+            self.client.get(reverse('content:api_articles'), {'sort': 'oldest'}).content
+        )
+        by_cursor = self.client.get(
+            reverse('content:api_articles'),
+            {'sort': 'oldest', 'page': 2, 'cursor': first['pagination']['next_cursor']},
+        )
+        by_offset = self.client.get(
+            reverse('content:api_articles'), {'sort': 'oldest', 'page': 2},
+        )
+        self.assertEqual(
+            json.loads(by_cursor.content)['articles'],
+            json.loads(by_offset.content)['articles'],
+        )
+
+    def test_cursor_pages_include_undated_articles(self):
+        for i in range(7):
+            Article.objects.create(
+                title=f'Undated {i + 1}',
+                author=self.author,
+                status=ArticleStatus.PUBLISHED,
+                language=LanguageChoices.EN,
+            )
+        for sort in ('recent', 'oldest'):
+            cursor, by_cursor, by_offset = '', [], []
+            for page in (1, 2, 3):
+                data = json.loads(self.client.get(
+                    reverse('content:api_articles'), {'sort': sort, 'page': page, 'cursor': cursor},
+                ).content)
+                by_cursor += [a['title'] for a in data['articles']]
+                cursor = data['pagination']['next_cursor'] or ''
+                by_offset += [a['title'] for a in json.loads(self.client.get(
+                    reverse('content:api_articles'), {'sort': sort, 'page': page},
+                ).content)['articles']]
+            self.assertEqual(by_cursor, by_offset)
+            self.assertEqual(len(set(by_cursor)), 15)
+
+    def test_categories_loaded_in_one_query(self):
+        category = Category.objects.create(name='Prefetched', is_active=True)
+        for article in Article.objects.all():
+            article.categories.add(category)
+        self.client.get(reverse('content:api_articles'))
+        Article.bump_api_list_cache_version()
+        # ATOMIC_REQUESTS savepoint pair + article rows + one categories query
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('content:api_articles'))
+        data = json.loads(response.content)
+        self.assertEqual(data['articles'][0]['categories'], ['Prefetched'])
+
+    def test_repeated_listing_served_from_cache(self):
+        first = self.client.get(reverse('content:api_articles'))
+        # Only the ATOMIC_REQUESTS savepoint pair remains
+        with self.assertNumQueries(2):
+            second = self.client.get(reverse('content:api_articles'))
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second['Content-Type'], 'application/json')
+
+    def test_cached_listing_invalidated_on_publish(self):
+        self.client.get(reverse('content:api_articles'))
+        Article.objects.create(
+            title='Keyset New',
+            author=self.author,
+            status=ArticleStatus.PUBLISHED,
+            language=LanguageChoices.EN,
+            published_at=timezone.now() + timedelta(hours=1),
+        )
+        data = json.loads(self.client.get(reverse('content:api_articles')).content)
+        self.assertEqual(data['articles'][0]['title'], 'Keyset New')
+
+    def test_invalid_cursor_falls_back_to_page(self):
+        response = self.client.get(
+            reverse('content:api_articles'), {'page': 2, 'cursor': 'not-a-cursor'},
+        )
+        data = json.loads(response.content)
+        self.assertEqual(len(data['articles']), 2)
+
+
+class ArticlesApiFilterTest(TestCase):
+    """Test cases for search and category filters on the articles API."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.author = User.objects.create_user(
+            email='search@example.com',
+            password='testpass123',
+        )
+        for title, summary in [
+            ('DevOps Pipelines', 'Continuous delivery'),
+            ('Backend Caching', 'Redis patterns for Django'),
+        ]:
+            Article.objects.create(
+                title=title,
+                summary=summary,
+                author=self.author,
+                status=ArticleStatus.PUBLISHED,
+                language=LanguageChoices.EN,
+                published_at=timezone.now(),
+            )
+
+    def _search(self, term):
+        response = self.client.get(reverse('content:api_articles'), {'search': term})
+        return [a['title'] for a in json.loads(response.content)['articles']]
+
+    def test_search_matches_title_prefix(self):
+        self.assertEqual(self._search('devo'), ['DevOps Pipelines'])
+
+    def test_search_matches_summary(self):
+        self.assertEqual(self._search('redis django'), ['Backend Caching'])
+
+    def test_capped_count_uses_planner_estimate(self):
+        with mock.patch.object(ArticlesApiView, 'MAX_COUNTED_RESULTS', 1), \
+                mock.patch.object(DbFunctions, 'estimated_count', return_value=500):
+            response = self.client.get(reverse('content:api_articles'), {'search': 'pipelines'})
+        pagination = json.loads(response.content)['pagination']
+        self.assertTrue(pagination['total_count_capped'])
+        self.assertTrue(pagination['count_is_estimate'])
+        self.assertEqual(pagination['total_count'], 500)
+
+    def test_exact_count_below_cap(self):
+        response = self.client.get(reverse('content:api_articles'), {'search': 'devops'})
+        pagination = json.loads(response.content)['pagination']
+        self.assertFalse(pagination['count_is_estimate'])
+        self.assertEqual(pagination['total_count'], 1)
+
+    def test_estimated_count_reads_plan(self):
+        estimate = DbFunctions.estimated_count(Article.objects.filter(status=ArticleStatus.PUBLISHED))
+        self.assertIsInstance(estimate, int)
+        self.assertGreaterEqual(estimate, 0)
+
+    def test_search_without_words_returns_nothing(self):
+        self.assertEqual(self._search('???'), [])
+
+    def test_malformed_category_ids_are_dropped(self):
+        category = Category.objects.create(name='Ops', is_active=True)
+        Article.objects.get(title='DevOps Pipelines').categories.add(category)
+        response = self.client.get(
+            reverse('content:api_articles'),
+            {'categories': f'not-a-uuid,{category.id}'},
+        )
+        self.assertEqual(response.status_code, 200)
+        titles = [a['title'] for a in json.loads(response.content)['articles']]
+        self.assertEqual(titles, ['DevOps Pipelines'])
+
+    def test_multi_category_filter_returns_each_article_once(self):
+        ops = Category.objects.create(name='Ops', is_active=True)
+        cache_cat = Category.objects.create(name='Cache', is_active=True)
+        Article.objects.get(title='DevOps Pipelines').categories.add(ops, cache_cat)
+        response = self.client.get(
+            reverse('content:api_articles'),
+            {'categories': f'{ops.id},{cache_cat.id}'},
+        )
+        data = json.loads(response.content)
+        self.assertEqual([a['title'] for a in data['articles']], ['DevOps Pipelines'])
+        self.assertEqual(data['pagination']['total_count'], 1)
+
+    def test_only_malformed_category_ids_return_400(self):
+        response = self.client.get(
+            reverse('content:api_articles'), {'categories': 'not-a-uuid'},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_empty_search_skips_row_query(self):
+        self._search('nomatch')
+        Article.bump_api_list_cache_version()
+        # ATOMIC_REQUESTS savepoint pair + bounded count only
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse('content:api_articles'), {'search': 'nomatch'},
+            )
+        data = json.loads(response.content)
+        self.assertEqual(data['articles'], [])
+        self.assertEqual(data['pagination']['total_pages'], 1)
+        self.assertFalse(data['pagination']['has_next'])
+
+    def test_search_vector_follows_title_change(self):
+        article = Article.objects.get(title='Backend Caching')
+        article.title = 'Frontend Caching'
+        article.save()
+        self.assertEqual(self._search('frontend'), ['Frontend Caching'])
+
+
+class PublishedCountCacheTest(TestCase):
+    """Test cases for the cached published-articles count."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            email='count@example.com',
+            password='testpass123',
+        )
+        self.article = Article.objects.create(
+            title='Counted',
+            author=self.author,
+            status=ArticleStatus.DRAFT,
+            language=LanguageChoices.EN,
+        )
+
+    def test_count_served_from_cache(self):
+        Article.get_published_count_from_cache()
+        with self.assertNumQueries(0):
+            Article.get_published_count_from_cache()
+
+    def test_count_invalidated_on_publish(self):
+        self.assertEqual(Article.get_published_count_from_cache(), 0)
+        self.article.status = ArticleStatus.PUBLISHED
+        self.article.published_at = timezone.now()
+        self.article.save()
+        self.assertEqual(Article.get_published_count_from_cache(), 1)
+
+    def test_count_kept_on_unrelated_save(self):
+        Article.get_published_count_from_cache()
+        self.article.summary = 'Updated'
+        self.article.save()
+        with self.assertNumQueries(0):
+            Article.get_published_count_from_cache()
+
+
 class FeaturedArticlesApiViewTest(TestCase):
     """Test cases for the featured articles API endpoint."""
 
@@ -213,6 +481,82 @@ class FeaturedArticlesApiViewTest(TestCase):
         self.assertEqual(len(data['featured']), 0)
 
 
+class FeaturedArticlesConfigCacheTest(TestCase):
+    """Test cases for the cached FeaturedArticles singleton."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            email='featured@example.com',
+            password='testpass123',
+        )
+
+    def test_singleton_is_seeded(self):
+        self.assertTrue(
+            FeaturedArticles.objects.filter(pk=FEATURED_ARTICLES_UUID).exists(),
+        )
+
+    def test_featured_config_served_from_cache(self):
+        FeaturedArticles.get_featured_config()
+        with self.assertNumQueries(0):
+            config = FeaturedArticles.get_featured_config()
+        self.assertEqual(config.pk, FEATURED_ARTICLES_UUID)
+
+    def test_featured_config_loads_in_two_queries(self):
+        featured = FeaturedArticles.objects.get(pk=FEATURED_ARTICLES_UUID)
+        for position in ('first_feature', 'second_feature', 'third_feature'):
+            setattr(featured, position, Article.objects.create(
+                title=f'Feature {position}',
+                author=self.author,
+                status=ArticleStatus.PUBLISHED,
+                language=LanguageChoices.EN,
+                published_at=timezone.now(),
+            ))
+        featured.save()
+        with self.assertNumQueries(2):
+            config = FeaturedArticles.get_featured_config()
+            [c.name for c in config.third_feature.categories.all()]
+
+    def test_featured_config_invalidated_on_save(self):
+        article = Article.objects.create(
+            title='Cached Feature',
+            author=self.author,
+            status=ArticleStatus.PUBLISHED,
+            language=LanguageChoices.EN,
+            published_at=timezone.now(),
+        )
+        FeaturedArticles.get_featured_articles_from_cache()
+        featured = FeaturedArticles.objects.get(pk=FEATURED_ARTICLES_UUID)
+        featured.first_feature = article
+        featured.save()
+
+        featured_map = FeaturedArticles.get_featured_articles_from_cache()
+        self.assertEqual(featured_map['first'], article)
+
+    def test_configuration_exists_served_from_cache(self):
+        self.assertTrue(FeaturedArticles.configuration_exists())
+        with self.assertNumQueries(0):
+            self.assertTrue(FeaturedArticles.configuration_exists())
+
+    def test_configuration_exists_invalidated_on_delete(self):
+        FeaturedArticles.configuration_exists()
+        FeaturedArticles.objects.get(pk=FEATURED_ARTICLES_UUID).delete()
+        self.assertFalse(FeaturedArticles.configuration_exists())
+
+    def test_published_choices_invalidated_on_article_save(self):
+        self.assertEqual(FeaturedArticles.get_published_choices(), ())
+        article = Article.objects.create(
+            title='Choice',
+            author=self.author,
+            status=ArticleStatus.PUBLISHED,
+            language=LanguageChoices.EN,
+            published_at=timezone.now(),
+        )
+        self.assertEqual(
+            FeaturedArticles.get_published_choices(), ((article.pk, 'Choice'),)
+        )
+
+
 class RelatedArticlesApiViewTest(TestCase):
     """Test cases for the related articles API endpoint."""
 
@@ -273,6 +617,7 @@ class CategoriesApiViewTest(TestCase):
 
     def setUp(self):
         self.client = Client()
+        cache.clear()
 
     def test_categories_api_returns_json(self):
         response = self.client.get(reverse('content:api_categories'))
@@ -298,6 +643,29 @@ class CategoriesApiViewTest(TestCase):
         self.assertIn('name', cat)
         self.assertIn('slug', cat)
 
+    def test_categories_api_served_from_cache(self):
+        Category.objects.create(name='Cached Cat', is_active=True)
+        self.client.get(reverse('content:api_categories'))
+        # Only the ATOMIC_REQUESTS savepoint pair remains
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('content:api_categories'))
+        self.assertEqual(json.loads(response.content)['categories'][0]['name'], 'Cached Cat')
+
+    def test_categories_api_not_modified_for_matching_etag(self):
+        Category.objects.create(name='Etag Cat', is_active=True)
+        etag = self.client.get(reverse('content:api_categories'))['ETag']
+        response = self.client.get(reverse('content:api_categories'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_categories_api_cache_cleared_on_save(self):
+        category = Category.objects.create(name='Before', is_active=True)
+        etag = self.client.get(reverse('content:api_categories'))['ETag']
+        category.name = 'After'
+        category.save()
+        response = self.client.get(reverse('content:api_categories'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['categories'][0]['name'], 'After')
+
 
 class ArticlesListViewTest(TestCase):
     """Test cases for the articles listing template view."""
@@ -312,3 +680,4 @@ class ArticlesListViewTest(TestCase):
             response,
             'tech-articles/home/pages/articles/articles_list.html',
         )
+
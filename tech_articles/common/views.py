@@ -1,13 +1,26 @@
 import logging
+from datetime import timedelta
 
+from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
+from django.http import HttpResponseRedirect
+from django.shortcuts import get_object_or_404, redirect
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
 
-from tech_articles.billing.models import Plan
+from tech_articles.appointments.models import (
+    Appointment,
+    AppointmentSettings,
+    AppointmentSlot,
+    AppointmentType,
+)
+from tech_articles.billing.cache import BillingCache
+from tech_articles.billing.services import AppointmentPaymentService
 from tech_articles.content.models import FeaturedArticles, Course, Article
+from tech_articles.utils.enums import AppointmentStatus, PaymentProvider, PaymentStatus
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +39,7 @@ class HomePageView(TemplateView):
     def get_context_data(self, **kwargs):
         """Add active plans and featured articles to context."""
         context = super().get_context_data(**kwargs)
-        context["active_plans"] = Plan.objects.filter(is_active=True).prefetch_related(
-            "plan_features"
-        )
+        context["active_plans"] = BillingCache.get_active_plans()
 
         # Get featured articles from cache helper (ensures singleton and prefetch)
         try:
@@ -41,9 +52,11 @@ class HomePageView(TemplateView):
         context["third_featured_article"] = featured_map.get("third")
 
         # Add featured courses (most recent active ones)
-        context["featured_courses"] = Course.objects.filter(is_active=True).order_by(
-            "-created_at"
-        )[:3]
+        context["featured_courses"] = (
+            Course.objects.filter(is_active=True)
+            .prefetch_related("tags")
+            .order_by("-created_at")[:3]
+        )
 
         # Add latest 6 published articles (from cache)
         try:
@@ -64,8 +77,6 @@ class AppointmentListHomeView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        from tech_articles.appointments.models import AppointmentSettings
-
         context["appointment_settings"] = AppointmentSettings.get_settings()
         return context
 
@@ -83,31 +94,34 @@ class AppointmentDetailHomeView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         slot_id = self.kwargs.get("slot_id")
-        from tech_articles.appointments.models import Appointment
 
         # In this context, we expect an Appointment to exist for the slot
         try:
-            appointment = Appointment.objects.select_related(
-                "slot", "appointment_type"
-            ).get(slot_id=slot_id)
+            appointment = (
+                Appointment.objects.select_related("slot", "appointment_type")
+                .only(
+                    "id",
+                    "slot__start_at",
+                    "slot__end_at",
+                    "appointment_type__name",
+                    "appointment_type__description",
+                    "duration_minutes",
+                    "total_amount",
+                    "currency",
+                    "status",
+                    "payment_status",
+                )
+                .get(slot_id=slot_id)
+            )
             context["appointment"] = appointment
         except Appointment.DoesNotExist:
             context["appointment"] = None
 
-        from tech_articles.appointments.models import AppointmentSettings
-
         context["appointment_settings"] = AppointmentSettings.get_settings()
 
         return context
 
     def post(self, request, *args, **kwargs):
-        from django.shortcuts import get_object_or_404, redirect
-        from django.urls import reverse
-        from django.contrib import messages
-        from tech_articles.appointments.models import Appointment
-        from tech_articles.billing.services import AppointmentPaymentService
-        from tech_articles.utils.enums import PaymentProvider
-
         slot_id = self.kwargs.get("slot_id")
         appointment = get_object_or_404(Appointment, slot_id=slot_id, user=request.user)
 
@@ -141,8 +155,6 @@ class AppointmentServiceSelectionView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        from tech_articles.appointments.models import AppointmentType
-        from django.utils.dateparse import parse_datetime
 
         start_at_str = self.request.GET.get("start")
         end_at_str = self.request.GET.get("end")
@@ -158,12 +170,7 @@ class AppointmentServiceSelectionView(LoginRequiredMixin, TemplateView):
         processed_services = []
 
         for service in services:
-            # Parse allowed durations
-            durations = [
-                int(d.strip())
-                for d in service.allowed_durations_minutes.split(",")
-                if d.strip().isdigit()
-            ]
+            durations = list(service.durations_list)
             # Filter durations that fit in the block
             available_durations = [d for d in durations if d <= block_duration_mins]
 
@@ -187,20 +194,6 @@ class AppointmentServiceSelectionView(LoginRequiredMixin, TemplateView):
         return context
 
     def post(self, request, *args, **kwargs):
-        from tech_articles.appointments.models import (
-            Appointment,
-            AppointmentSlot,
-            AppointmentType,
-        )
-        from tech_articles.utils.enums import AppointmentStatus, PaymentStatus
-        from django.utils.dateparse import parse_datetime
-        from datetime import timedelta
-        from django.urls import reverse
-        from django.http import HttpResponseRedirect
-        from django.contrib import messages
-        from django.utils.translation import gettext as _
-        from decimal import Decimal
-
         start_at_str = request.POST.get("start_at")
         service_id = request.POST.get("service_id")
         duration = request.POST.get("duration")
@@ -214,23 +207,13 @@ class AppointmentServiceSelectionView(LoginRequiredMixin, TemplateView):
         duration_mins = int(duration)
         end_dt = dt + timedelta(minutes=duration_mins)
 
-        # 1. Create/Check Slot
-        # Important: Since we support dynamic blocks, we check if this specific range overlaps with any booked slot
-        conflicting = AppointmentSlot.objects.filter(
-            Q(
-                Q(is_booked=True)
-                & Q(
-                    appointment__payment_status__in=[
-                        PaymentStatus.SUCCEEDED,
-                        PaymentStatus.FREE_ACCEPTED,
-                    ]
-                )
-            ),
-            start_at__lt=end_dt,
-            end_at__gt=dt,
-        ).exists()
+        hourly_rate = service.base_hourly_rate
+        total_amount = service.get_total_amount(duration_mins)
 
-        if conflicting:
+        # 1. Check for any confirmed booking overlapping this dynamic range;
+        # pending bookings do not hold the range, so payment confirmation
+        # checks again (see AppointmentPaymentService.confirm_payment)
+        if AppointmentSlot.has_confirmed_overlap(dt, end_dt):
             messages.error(
                 request,
                 _(
@@ -239,15 +222,10 @@ class AppointmentServiceSelectionView(LoginRequiredMixin, TemplateView):
             )
             return HttpResponseRedirect(reverse("common:appointments_book"))
 
-        # Create the materialized slot
+        # 2. Create the materialized slot and its appointment
         slot = AppointmentSlot.objects.create(
             start_at=dt, end_at=end_dt, is_booked=True, booked_at=timezone.now()
         )
-
-        # 2. Create Appointment
-        hourly_rate = service.base_hourly_rate
-        total_amount = (hourly_rate * Decimal(duration_mins)) / Decimal(60)
-
         Appointment.objects.create(
             user=request.user,
             slot=slot,
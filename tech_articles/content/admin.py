@@ -42,9 +42,32 @@ class ArticleAdmin(admin.ModelAdmin):
     list_filter = ['status', 'language', 'difficulty', 'access_type', 'created_at', 'published_at']
     search_fields = ['title', 'slug', 'summary']
     prepopulated_fields = {'slug': ('title',)}
-    filter_horizontal = ['categories', 'tags']
-    date_hierarchy = 'created_at'
+    # Options are fetched on demand instead of rendering every category/tag/user
+    autocomplete_fields = ['categories', 'tags', 'author']
+    # No date_hierarchy: its MIN/MAX and date-grouping queries scan the whole
+    # table on every changelist load; the created_at list_filter covers it.
     ordering = ['-created_at']
+    # Large text columns that the changelist never renders
+    changelist_deferred_fields = (
+        'summary', 'preview_content', 'search_vector',
+        'seo_description', 'cover_alt_text',
+    )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == 'content_article_changelist':
+            # The change form needs every column; deferring there would
+            # cost one extra query per field
+            queryset = queryset.defer(*self.changelist_deferred_fields)
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        """Match words against the indexed search vector instead of ILIKE scans."""
+        query = Article.build_search_query(search_term) if search_term else None
+        if query is None:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(search_vector=query), False
 
 
 @admin.register(ArticlePage)
@@ -54,17 +77,19 @@ class ArticlePageAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['title', 'article__title']
     ordering = ['article', 'page_number']
+    list_select_related = ['article']
 
 
 @admin.register(FeaturedArticles)
 class FeaturedArticlesAdmin(admin.ModelAdmin):
     """Admin interface for FeaturedArticles model."""
     list_display = ['id', 'first_feature', 'second_feature', 'third_feature', 'updated_at']
+    list_select_related = ['first_feature', 'second_feature', 'third_feature']
     fields = ['first_feature', 'second_feature', 'third_feature']
     
     def has_add_permission(self, request):
         """Only allow one instance of FeaturedArticles."""
-        return not FeaturedArticles.objects.exists()
+        return not FeaturedArticles.configuration_exists()
     
     def has_delete_permission(self, request, obj=None):
         """Prevent deletion of the configuration."""
@@ -78,6 +103,7 @@ class ClapAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['article__title', 'user__username', 'session_key']
     ordering = ['-created_at']
+    list_select_related = ['article', 'user']
 
 
 @admin.register(Like)
@@ -87,6 +113,7 @@ class LikeAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['article__title', 'user__username']
     ordering = ['-created_at']
+    list_select_related = ['article', 'user']
 
 
 @admin.register(Comment)
@@ -96,6 +123,7 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ['is_edited', 'created_at']
     search_fields = ['article__title', 'user__username', 'content']
     ordering = ['-created_at']
+    list_select_related = ['article', 'user']
 
     def content_preview(self, obj):
         """Show first 50 characters of comment."""
@@ -109,6 +137,7 @@ class CommentLikeAdmin(admin.ModelAdmin):
     list_display = ['comment', 'user', 'created_at']
     list_filter = ['created_at']
     search_fields = ['comment__content', 'user__username']
+    list_select_related = ['comment__user', 'user']
     
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
@@ -1,5 +1,3 @@
-from contextlib import suppress
-
 from django.apps import AppConfig
 
 
@@ -9,6 +7,4 @@ class ContentConfig(AppConfig):
 
     def ready(self):
         # Import signal handlers to ensure they are registered
-        # Use contextlib.suppress to avoid noisy exceptions during migrations/tests
-        with suppress(Exception, ImportError):
-            from . import signals  # noqa: F401
+        from . import signals  # noqa: F401
@@ -1,18 +1,51 @@
 """
 Article forms for dashboard CRUD operations.
 """
+from functools import lru_cache
+
 from django import forms
-from django.utils.translation import gettext_lazy as _
+from django.contrib.auth import get_user_model
+from django.forms.models import ModelChoiceIterator
+from django.utils.translation import get_language, gettext_lazy as _
 
 from tech_articles.content.models import Article, ArticlePage, Category, Tag
 from tech_articles.utils.enums import CurrencyChoices
 
+from .widget_attrs import FULL_INPUT, FULL_SELECT, FULL_TEXTAREA, INPUT, SELECT, TEXTAREA
+
+
+@lru_cache(maxsize=8)
+def currency_choices(language):
+    """Currency choices with labels resolved once per active language."""
+    return tuple((c.value, str(c.label)) for c in CurrencyChoices)
+
+
+class NameChoiceIterator(ModelChoiceIterator):
+    """Yield ``(pk, name)`` rows straight from the database, skipping model instances."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self.queryset.values_list("pk", "name")
+
+
+class NameMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """Multiple choice field for models whose label is their ``name``."""
+
+    iterator = NameChoiceIterator
 
-# Currency choices (use TextChoices enum)
-CURRENCY_CHOICES = [(c.value, c.label) for c in CurrencyChoices]
 
+class RequiredTitleMixin:
+    """Strip the title and reject blank values."""
 
-class ArticleSetupForm(forms.ModelForm):
+    def clean_title(self):
+        title = self.cleaned_data.get("title", "").strip()
+        if not title:
+            raise forms.ValidationError(_("Article title is required."))
+        return title
+
+
+class ArticleSetupForm(RequiredTitleMixin, forms.ModelForm):
     """Form for basic article setup (Title + Language only)."""
 
     class Meta:
@@ -20,83 +53,62 @@ class ArticleSetupForm(forms.ModelForm):
         fields = ["title", "language"]
         widgets = {
             "title": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("E.g.: Introduction to DevOps Practices"),
                 "autocomplete": "off",
                 "required": True,
                 "maxlength": 150,
             }),
-            "language": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
+            "language": forms.Select(attrs=FULL_SELECT),
         }
 
-    def clean_title(self):
-        title = self.cleaned_data.get("title", "").strip()
-        if not title:
-            raise forms.ValidationError(_("Article title is required."))
-        return title
 
-
-class ArticleQuickCreateForm(forms.ModelForm):
+class ArticleQuickCreateForm(RequiredTitleMixin, forms.ModelForm):
     """Form for quick article creation (Setup flow)."""
 
     class Meta:
         model = Article
         fields = ["title", "categories", "language"]
+        field_classes = {"categories": NameMultipleChoiceField}
         widgets = {
             "title": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter article title"),
                 "autocomplete": "off",
                 "required": True,
             }),
-            "categories": forms.SelectMultiple(attrs={
-                "class": "dashboard-select w-full",
-            }),
-            "language": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
+            "categories": forms.SelectMultiple(attrs=FULL_SELECT),
+            "language": forms.Select(attrs=FULL_SELECT),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["categories"].queryset = Category.objects.filter(is_active=True)
-        self.fields["categories"].required = False
-
-    def clean_title(self):
-        title = self.cleaned_data.get("title", "").strip()
-        if not title:
-            raise forms.ValidationError(_("Article title is required."))
-        return title
+        # Options only render pk and name; skip descriptions and timestamps
+        self.fields["categories"].queryset = Category.objects.filter(is_active=True).only("pk", "name")
+        self.fields["categories"].choices = Category.get_active_choices()
 
 
-class ArticleDetailsForm(forms.ModelForm):
+class ArticleDetailsForm(RequiredTitleMixin, forms.ModelForm):
     """Form for editing article details (Mini Dashboard - Details tab)."""
 
     class Meta:
         model = Article
         fields = ["title", "language", "summary", "difficulty", "status", "categories", "tags", "reading_time_minutes"]
+        field_classes = {"categories": NameMultipleChoiceField, "tags": NameMultipleChoiceField}
         widgets = {
             "title": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter article title"),
                 "autocomplete": "off",
             }),
-            "language": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
+            "language": forms.Select(attrs=FULL_SELECT),
             "summary": forms.Textarea(attrs={
-                "class": "dashboard-textarea w-full",
+                **FULL_TEXTAREA,
                 "placeholder": _("Brief article summary"),
                 "rows": 4,
             }),
-            "difficulty": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
-            "status": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
+            "difficulty": forms.Select(attrs=FULL_SELECT),
+            "status": forms.Select(attrs=FULL_SELECT),
             "categories": forms.SelectMultiple(attrs={
                 "class": "w-full selectize-categories",
                 "placeholder": _("Select categories"),
@@ -106,7 +118,7 @@ class ArticleDetailsForm(forms.ModelForm):
                 "placeholder": _("Select tags"),
             }),
             "reading_time_minutes": forms.NumberInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("e.g. 5"),
                 "min": 1,
                 "max": 999,
@@ -115,16 +127,9 @@ class ArticleDetailsForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["categories"].queryset = Category.objects.filter(is_active=True)
-        self.fields["tags"].queryset = Tag.objects.all()
-        self.fields["categories"].required = False
-        self.fields["tags"].required = False
-
-    def clean_title(self):
-        title = self.cleaned_data.get("title", "").strip()
-        if not title:
-            raise forms.ValidationError(_("Article title is required."))
-        return title
+        self.fields["categories"].queryset = Category.objects.filter(is_active=True).only("pk", "name")
+        self.fields["categories"].choices = Category.get_active_choices()
+        self.fields["tags"].queryset = Tag.objects.only("pk", "name")
 
 
 class ArticleSEOForm(forms.ModelForm):
@@ -135,37 +140,32 @@ class ArticleSEOForm(forms.ModelForm):
         fields = ["seo_title", "seo_description", "canonical_url", "cover_image", "cover_alt_text"]
         widgets = {
             "seo_title": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Meta title for search engines (max 70 characters)"),
                 "autocomplete": "off",
                 "maxlength": 70,
             }),
             "seo_description": forms.Textarea(attrs={
-                "class": "dashboard-textarea w-full",
+                **FULL_TEXTAREA,
                 "placeholder": _("Meta description for search engines (max 160 characters)"),
                 "rows": 3,
                 "maxlength": 160,
             }),
             "canonical_url": forms.URLInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("https://example.com/article"),
             }),
             "cover_image": forms.FileInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "accept": "image/*",
             }),
             "cover_alt_text": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Descriptive text for the cover image"),
                 "autocomplete": "off",
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.required = False
-
 
 class ArticlePricingForm(forms.ModelForm):
     """Form for editing article pricing (Mini Dashboard - Pricing tab)."""
@@ -174,23 +174,19 @@ class ArticlePricingForm(forms.ModelForm):
         model = Article
         fields = ["access_type", "price", "currency"]
         widgets = {
-            "access_type": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }),
+            "access_type": forms.Select(attrs=FULL_SELECT),
             "price": forms.NumberInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": "0.00",
                 "step": "0.01",
                 "min": "0",
             }),
-            "currency": forms.Select(attrs={
-                "class": "dashboard-select w-full",
-            }, choices=CURRENCY_CHOICES),
+            "currency": forms.Select(attrs=FULL_SELECT),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["price"].required = False
+        self.fields["currency"].widget.choices = currency_choices(get_language())
 
     def clean(self):
         cleaned_data = super().clean()
@@ -211,18 +207,14 @@ class ArticlePreviewForm(forms.ModelForm):
         fields = ["preview_content"]
         widgets = {
             "preview_content": forms.Textarea(attrs={
-                "class": "dashboard-textarea w-full",
+                **FULL_TEXTAREA,
                 "placeholder": _("Preview content in Markdown format..."),
                 "rows": 10,
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["preview_content"].required = False
-
 
-class ArticleForm(forms.ModelForm):
+class ArticleForm(RequiredTitleMixin, forms.ModelForm):
     """Form for creating and updating articles."""
 
     class Meta:
@@ -233,123 +225,99 @@ class ArticleForm(forms.ModelForm):
             "cover_alt_text", "reading_time_minutes", "youtube_url", "youtube_start_seconds",
             "categories", "tags", "author", "published_at"
         ]
+        field_classes = {"categories": NameMultipleChoiceField, "tags": NameMultipleChoiceField}
+        error_messages = {
+            "slug": {"unique": _("An article with this slug already exists.")},
+        }
         widgets = {
             "title": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Enter article title"),
                 "autocomplete": "off",
             }),
             "slug": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("URL-friendly identifier (auto-generated if empty)"),
                 "autocomplete": "off",
             }),
-            "language": forms.Select(attrs={
-                "class": "dashboard-select",
-            }),
-            "status": forms.Select(attrs={
-                "class": "dashboard-select",
-            }),
-            "difficulty": forms.Select(attrs={
-                "class": "dashboard-select",
-            }),
-            "access_type": forms.Select(attrs={
-                "class": "dashboard-select",
-            }),
+            "language": forms.Select(attrs=SELECT),
+            "status": forms.Select(attrs=SELECT),
+            "difficulty": forms.Select(attrs=SELECT),
+            "access_type": forms.Select(attrs=SELECT),
             "price": forms.NumberInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": "0.00",
                 "step": "0.01",
             }),
             "currency": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": "USD",
             }),
             "seo_title": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Meta title for search engines"),
                 "autocomplete": "off",
             }),
             "seo_description": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Meta description for search engines"),
                 "autocomplete": "off",
             }),
             "canonical_url": forms.URLInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Canonical URL for duplicate content"),
             }),
             "summary": forms.Textarea(attrs={
-                "class": "dashboard-textarea",
+                **TEXTAREA,
                 "placeholder": _("Brief article summary"),
                 "rows": 3,
             }),
             "cover_image": forms.FileInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "accept": "image/*",
             }),
             "cover_alt_text": forms.TextInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Alternative text for cover image"),
                 "autocomplete": "off",
             }),
             "reading_time_minutes": forms.NumberInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": "0",
             }),
             "youtube_url": forms.URLInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": _("Optional YouTube video URL"),
             }),
             "youtube_start_seconds": forms.NumberInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "placeholder": "0",
             }),
-            "categories": forms.SelectMultiple(attrs={
-                "class": "dashboard-select",
-            }),
-            "tags": forms.SelectMultiple(attrs={
-                "class": "dashboard-select",
-            }),
-            "author": forms.Select(attrs={
-                "class": "dashboard-select",
-            }),
+            "categories": forms.SelectMultiple(attrs=SELECT),
+            "tags": forms.SelectMultiple(attrs=SELECT),
+            "author": forms.Select(attrs=SELECT),
             "published_at": forms.DateTimeInput(attrs={
-                "class": "dashboard-input",
+                **INPUT,
                 "type": "datetime-local",
             }),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Blank slugs are generated from the title on save
         self.fields["slug"].required = False
-        self.fields["price"].required = False
-        self.fields["seo_title"].required = False
-        self.fields["seo_description"].required = False
-        self.fields["canonical_url"].required = False
-        self.fields["summary"].required = False
-        self.fields["cover_image"].required = False
-        self.fields["cover_alt_text"].required = False
-        self.fields["youtube_url"].required = False
-        self.fields["author"].required = False
-        self.fields["published_at"].required = False
-
-    def clean_title(self):
-        title = self.cleaned_data.get("title", "").strip()
-        if not title:
-            raise forms.ValidationError(_("Article title is required."))
-        return title
+        # Labels only need the name / email, so skip the rest of each row
+        self.fields["categories"].queryset = Category.objects.filter(is_active=True).only("pk", "name")
+        self.fields["categories"].choices = Category.get_active_choices()
+        self.fields["tags"].queryset = Tag.objects.only("pk", "name")
+        self.fields["author"].queryset = get_user_model().objects.only("pk", "email")
 
     def clean_slug(self):
-        slug = self.cleaned_data.get("slug", "").strip()
-        if slug:
-            # Check for duplicates excluding current instance
-            qs = Article.objects.filter(slug=slug)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise forms.ValidationError(_("An article with this slug already exists."))
-        return slug
+        # Duplicates are rejected by the model's unique check in validate_unique().
+        # Relying on the INSERT's IntegrityError instead would need a savepoint
+        # (requests run inside ATOMIC_REQUESTS): SAVEPOINT plus RELEASE is two
+        # statements against the one indexed EXISTS probe, so it saves nothing.
+        return self.cleaned_data.get("slug", "").strip()
 
 
 class ArticlePageForm(forms.ModelForm):
@@ -360,17 +328,17 @@ class ArticlePageForm(forms.ModelForm):
         fields = ["title", "page_number", "content"]
         widgets = {
             "title": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Page title (optional)"),
                 "autocomplete": "off",
             }),
             "page_number": forms.NumberInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "min": "1",
                 "placeholder": _("Page number"),
             }),
             "content": forms.Textarea(attrs={
-                "class": "dashboard-textarea w-full",
+                **FULL_TEXTAREA,
                 "placeholder": _("Markdown/MDX content for this page..."),
                 "rows": 15,
             }),
@@ -379,15 +347,16 @@ class ArticlePageForm(forms.ModelForm):
     def __init__(self, *args, article=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.article = article
-        self.fields["title"].required = False
 
     def clean_page_number(self):
         page_number = self.cleaned_data.get("page_number")
         if page_number is None or page_number < 1:
             raise forms.ValidationError(_("Page number must be at least 1."))
 
-        # Check for duplicates within the same article
-        if self.article:
+        # Check for duplicates within the same article; edits that keep the
+        # page's current number cannot collide, so they skip the lookup
+        unchanged = not self.instance._state.adding and page_number == self.instance.page_number
+        if self.article and not unchanged:
             qs = ArticlePage.objects.filter(article=self.article, page_number=page_number)
             if self.instance.pk:
                 qs = qs.exclude(pk=self.instance.pk)
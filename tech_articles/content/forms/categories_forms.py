@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from tech_articles.content.models import Category
 
+from .widget_attrs import FULL_INPUT, FULL_TEXTAREA
+
 
 class CategoryForm(forms.ModelForm):
     """Form for creating and updating categories."""
@@ -15,17 +17,17 @@ class CategoryForm(forms.ModelForm):
         fields = ["name", "slug", "description", "is_active", "sort_order"]
         widgets = {
             "name": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter category name"),
                 "autocomplete": "off",
             }),
             "slug": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("URL-friendly identifier (auto-generated if empty)"),
                 "autocomplete": "off",
             }),
             "description": forms.Textarea(attrs={
-                "class": "dashboard-textarea w-full",
+                **FULL_TEXTAREA,
                 "placeholder": _("Optional description for this category"),
                 "rows": 3,
             }),
@@ -33,7 +35,7 @@ class CategoryForm(forms.ModelForm):
                 "class": "dashboard-checkbox",
             }),
             "sort_order": forms.NumberInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": "0",
                 "min": 0,
             }),
@@ -42,13 +44,16 @@ class CategoryForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields["slug"].required = False
-        self.fields["description"].required = False
 
     def clean_name(self):
         name = self.cleaned_data.get("name", "").strip()
         if not name:
             raise forms.ValidationError(_("Category name is required."))
 
+        # Edits that keep the current name (compared like iexact) cannot collide
+        if not self.instance._state.adding and name.upper() == self.instance.name.upper():
+            return name
+
         # Check for duplicates excluding current instance
         qs = Category.objects.filter(name__iexact=name)
         if self.instance.pk:
@@ -60,7 +65,8 @@ class CategoryForm(forms.ModelForm):
 
     def clean_slug(self):
         slug = self.cleaned_data.get("slug", "").strip()
-        if slug:
+        # Edits that keep the current slug cannot collide
+        if slug and (self.instance._state.adding or slug != self.instance.slug):
             # Check for duplicates excluding current instance
             qs = Category.objects.filter(slug=slug)
             if self.instance.pk:
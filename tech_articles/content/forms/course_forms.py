@@ -2,6 +2,8 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 from tech_articles.content.models import Course, CourseTag
 
+from .widget_attrs import FULL_INPUT
+
 class CourseForm(forms.ModelForm):
     """Form for creating and updating courses in the dashboard."""
 
@@ -10,33 +12,26 @@ class CourseForm(forms.ModelForm):
         fields = ["name", "url", "description", "thumbnail", "language", "tags", "is_active"]
         widgets = {
             "name": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter course name")
             }),
             "url": forms.URLInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("https://example.com/course")
             }),
             "description": forms.Textarea(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter course description"),
                 "rows": 4
             }),
-            "language": forms.Select(attrs={
-                "class": "dashboard-input w-full"
-            }),
-            "tags": forms.SelectMultiple(attrs={
-                "class": "dashboard-input w-full"
-            }),
+            "thumbnail": forms.ClearableFileInput(attrs=FULL_INPUT),
+            "language": forms.Select(attrs=FULL_INPUT),
+            "tags": forms.SelectMultiple(attrs=FULL_INPUT),
             "is_active": forms.CheckboxInput(attrs={
                 "class": "w-4 h-4 text-primary bg-surface-dark border-border-dark rounded focus:ring-primary w-full"
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["thumbnail"].widget.attrs.update({"class": "dashboard-input w-full"})
-
 class CourseTagForm(forms.ModelForm):
     """Form for creating and updating course tags."""
 
@@ -45,7 +40,7 @@ class CourseTagForm(forms.ModelForm):
         fields = ["name"]
         widgets = {
             "name": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter tag name"),
                 "autocomplete": "off",
             }),
@@ -1,6 +1,7 @@
 """
 Featured Articles form for dashboard management.
 """
+import uuid
 
 from django import forms
 from django.utils.translation import gettext_lazy as _
@@ -8,12 +9,36 @@ from django.utils.translation import gettext_lazy as _
 from tech_articles.content.models import FeaturedArticles, Article
 
 
+FEATURE_FIELDS = ("first_feature", "second_feature", "third_feature")
+
+
+class ArticlePickField(forms.ModelChoiceField):
+    """Choice field that only parses the submitted pk.
+
+    The form resolves every pick in one query in ``clean()`` instead of
+    running one lookup per field.
+    """
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return uuid.UUID(str(value))
+        except ValueError:
+            raise forms.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            ) from None
+
+
 class FeaturedArticlesForm(forms.ModelForm):
     """Form for managing featured articles displayed on the homepage."""
 
     class Meta:
         model = FeaturedArticles
-        fields = ["first_feature", "second_feature", "third_feature"]
+        fields = list(FEATURE_FIELDS)
+        field_classes = {name: ArticlePickField for name in FEATURE_FIELDS}
         widgets = {
             "first_feature": forms.Select(
                 attrs={
@@ -37,12 +62,35 @@ class FeaturedArticlesForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Only show published articles in the dropdown
-        qs = Article.objects.filter(status="published").order_by("-published_at")
-        for name in ("first_feature", "second_feature", "third_feature"):
+        # Only published articles are valid; the queryset now only validates
+        # submitted pks, so it loads just the title for the instance label
+        qs = Article.objects.filter(status="published").only("pk", "title").order_by("-published_at")
+        # The three selects share one cached list instead of each running the query
+        choices = FeaturedArticles.get_published_choices()
+        for name in FEATURE_FIELDS:
             self.fields[name].queryset = qs
-            # All fields are optional
-            self.fields[name].required = False
             # Remove the empty '---------' option
             if hasattr(self.fields[name], "empty_label"):
                 self.fields[name].empty_label = None
+            self.fields[name].choices = choices
+
+    def _get_validation_exclusions(self):
+        # clean() has already checked the picks against the published queryset;
+        # the model's ForeignKey.validate() would run one EXISTS per pick again
+        return super()._get_validation_exclusions() | set(FEATURE_FIELDS)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        picks = {name: cleaned_data[name] for name in FEATURE_FIELDS if cleaned_data.get(name)}
+        articles = self.fields["first_feature"].queryset.in_bulk(set(picks.values())) if picks else {}
+        for name, pk in picks.items():
+            if pk in articles:
+                cleaned_data[name] = articles[pk]
+            else:
+                field = self.fields[name]
+                self.add_error(name, forms.ValidationError(
+                    field.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": pk},
+                ))
+        return cleaned_data
@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from tech_articles.content.models import Tag
 
+from .widget_attrs import FULL_INPUT
+
 
 class TagForm(forms.ModelForm):
     """Form for creating and updating tags."""
@@ -15,12 +17,12 @@ class TagForm(forms.ModelForm):
         fields = ["name", "slug"]
         widgets = {
             "name": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("Enter tag name"),
                 "autocomplete": "off",
             }),
             "slug": forms.TextInput(attrs={
-                "class": "dashboard-input w-full",
+                **FULL_INPUT,
                 "placeholder": _("URL-friendly identifier (auto-generated if empty)"),
                 "autocomplete": "off",
             }),
@@ -35,6 +37,10 @@ class TagForm(forms.ModelForm):
         if not name:
             raise forms.ValidationError(_("Tag name is required."))
 
+        # Edits that keep the current name (compared like iexact) cannot collide
+        if not self.instance._state.adding and name.upper() == self.instance.name.upper():
+            return name
+
         # Check for duplicates excluding current instance
         qs = Tag.objects.filter(name__iexact=name)
         if self.instance.pk:
@@ -46,7 +52,8 @@ class TagForm(forms.ModelForm):
 
     def clean_slug(self):
         slug = self.cleaned_data.get("slug", "").strip()
-        if slug:
+        # Edits that keep the current slug cannot collide
+        if slug and (self.instance._state.adding or slug != self.instance.slug):
             # Check for duplicates excluding current instance
             qs = Tag.objects.filter(slug=slug)
             if self.instance.pk:
@@ -0,0 +1,13 @@
+"""
+Widget attributes shared by the dashboard forms.
+
+Widgets copy their attrs, so these dicts are never mutated; extend them
+with ``{**FULL_INPUT, "placeholder": ...}``.
+"""
+
+INPUT = {"class": "dashboard-input"}
+SELECT = {"class": "dashboard-select"}
+TEXTAREA = {"class": "dashboard-textarea"}
+FULL_INPUT = {"class": "dashboard-input w-full"}
+FULL_SELECT = {"class": "dashboard-select w-full"}
+FULL_TEXTAREA = {"class": "dashboard-textarea w-full"}
@@ -0,0 +1,22 @@
+import uuid
+
+from django.db import migrations
+
+FEATURED_ARTICLES_UUID = uuid.UUID("00000000-0000-0000-0000-000000000000")
+
+
+def seed_featured_articles(apps, schema_editor):
+    """Create the FeaturedArticles singleton so read paths never have to."""
+    FeaturedArticles = apps.get_model("content", "FeaturedArticles")
+    FeaturedArticles.objects.get_or_create(pk=FEATURED_ARTICLES_UUID)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0009_coursetag_course_language_course_tags_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_featured_articles, migrations.RunPython.noop),
+    ]
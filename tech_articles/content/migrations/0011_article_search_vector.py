@@ -0,0 +1,41 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:13
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def populate_search_vector(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+    Article.objects.update(
+        search_vector=SearchVector("title", weight="A", config="simple")
+        + SearchVector("summary", weight="B", config="simple")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0010_seed_featured_articles"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text search document built from title and summary",
+                null=True,
+                verbose_name="search vector",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="article_search_vector_gin"
+            ),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0011_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["status", "-reading_time_minutes", "-published_at"],
+                name="article_popular_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0012_article_popular_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='articlepage',
+            name='content_art_article_1a9d6a_idx',
+        ),
+    ]
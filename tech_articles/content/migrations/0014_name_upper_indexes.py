@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:50
+
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0013_articlepage_drop_duplicate_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(Upper("name"), name="category_name_upper_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(Upper("name"), name="tag_name_upper_idx"),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+
+    def count_of(model_name):
+        model = apps.get_model("content", model_name)
+        rows = (
+            model.objects.filter(article=OuterRef("pk"))
+            .order_by()
+            .values("article")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(rows), 0)
+
+    Article.objects.update(
+        claps_count=count_of("Clap"),
+        likes_count=count_of("Like"),
+        comments_count=count_of("Comment"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0014_name_upper_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="claps_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of readers who clapped",
+                verbose_name="claps count",
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="comments_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="comments count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="likes_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="likes count"
+            ),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0015_article_interaction_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='clap',
+            name='content_cla_article_b83d47_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='clap',
+            name='content_cla_article_ef2dcf_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='clap',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='clap',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('article', 'user'), name='clap_unique_article_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='clap',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', True)), fields=('article', 'session_key'), name='clap_unique_article_session'),
+        ),
+    ]
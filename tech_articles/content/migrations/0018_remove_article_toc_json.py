@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0017_published_recent_index'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='article',
+            name='toc_json',
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:06
+
+from django.db import migrations, models
+
+def populate_cover_image_urls(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+    storage = Article._meta.get_field("cover_image").storage
+    articles = list(
+        Article.objects.exclude(cover_image="")
+        .exclude(cover_image__isnull=True)
+        .only("pk", "cover_image")
+    )
+    for article in articles:
+        article.cover_image_url = storage.url(article.cover_image.name)
+    Article.objects.bulk_update(articles, ["cover_image_url"], batch_size=500)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0018_remove_article_toc_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='cover_image_url',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Public URL of the cover image', max_length=1024, verbose_name='cover image URL'),
+        ),
+        migrations.RunPython(populate_cover_image_urls, migrations.RunPython.noop),
+    ]
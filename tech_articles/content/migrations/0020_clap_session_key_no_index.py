@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0019_article_cover_image_url'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clap',
+            name='session_key',
+            field=models.CharField(blank=True, default='', help_text='Session key for anonymous users', max_length=40, verbose_name='session key'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0020_clap_session_key_no_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='commentlike',
+            name='content_com_comment_12db8a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='like',
+            name='content_lik_article_be3719_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0021_drop_duplicate_like_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articlepage',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='rendered HTML'),
+        ),
+        migrations.AddField(
+            model_name='articlepage',
+            name='rendered_html_version',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='rendered HTML version'),
+        ),
+    ]
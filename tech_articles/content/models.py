@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import re
+import uuid
 from decimal import Decimal
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorField
 from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Upper
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from tech_articles.common.models import UUIDModel, TimeStampedModel, PublishableModel
+from tech_articles.content.tasks import schedule_toc_regeneration
+from tech_articles.content.templatetags.markdown_filters import RENDER_VERSION, markdown_to_html
 from tech_articles.utils.constants import FEATURED_ARTICLES_UUID
 from tech_articles.utils.db_functions import DbFunctions
+from tech_articles.utils.http import dumps_json
 from tech_articles.utils.enums import (
     LanguageChoices,
     DifficultyChoices,
@@ -22,6 +33,16 @@ from tech_articles.utils.enums import (
 
 LATEST_ARTICLES_CACHE_KEY = "home:latest_articles"
 LATEST_ARTICLES_CACHE_TIMEOUT = 60 * 60 * 2
+PUBLISHED_ARTICLES_COUNT_CACHE_KEY = "articles:published_count"
+PUBLISHED_ARTICLES_COUNT_CACHE_TIMEOUT = 60
+ARTICLES_API_CACHE_VERSION_KEY = "articles_api:version"
+ARTICLES_API_CACHE_TIMEOUT = 60
+ACTIVE_CATEGORIES_API_CACHE_KEY = "categories_api:active"
+ACTIVE_CATEGORIES_API_CACHE_TIMEOUT = 60 * 60 * 24
+ACTIVE_CATEGORY_CHOICES_CACHE_KEY = "categories:active_choices"
+ACTIVE_CATEGORY_CHOICES_CACHE_TIMEOUT = 60 * 5
+ARTICLE_DETAIL_CACHE_TIMEOUT = 60 * 60
+ARTICLE_DETAIL_TAXONOMY_VERSION_KEY = "article_detail:taxonomy_version"
 
 
 class Category(UUIDModel, TimeStampedModel):
@@ -63,6 +84,8 @@ class Category(UUIDModel, TimeStampedModel):
         ordering = ["sort_order", "name"]
         indexes = [
             models.Index(fields=["is_active", "sort_order"]),
+            # Serves the case-insensitive duplicate check in CategoryForm
+            models.Index(Upper("name"), name="category_name_upper_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -73,6 +96,49 @@ class Category(UUIDModel, TimeStampedModel):
     def __str__(self) -> str:
         return self.name
 
+    @staticmethod
+    def get_active_api_payload_from_cache() -> dict:
+        """
+        Return the serialized active categories for the public API.
+
+        The result is a dict with the JSON ``body`` and its ``etag``; it is
+        cached until a category is saved or deleted.
+        """
+
+        def build():
+            rows = Category.objects.filter(is_active=True).order_by(
+                "sort_order", "name"
+            ).values_list("id", "name", "slug")
+            body = dumps_json(
+                {"categories": [
+                    {"id": pk, "name": name, "slug": slug}
+                    for pk, name, slug in rows
+                ]}
+            )
+            return {
+                "body": body,
+                "etag": hashlib.blake2b(body, digest_size=16).hexdigest(),
+            }
+
+        return cache.get_or_set(
+            ACTIVE_CATEGORIES_API_CACHE_KEY,
+            build,
+            ACTIVE_CATEGORIES_API_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def get_active_choices() -> tuple:
+        """Return ``(pk, name)`` pairs of the active categories for form selects, from cache."""
+        return cache.get_or_set(
+            ACTIVE_CATEGORY_CHOICES_CACHE_KEY,
+            lambda: tuple(
+                Category.objects.filter(is_active=True).order_by(
+                    "sort_order", "name"
+                ).values_list("pk", "name")
+            ),
+            ACTIVE_CATEGORY_CHOICES_CACHE_TIMEOUT,
+        )
+
 
 class Tag(UUIDModel, TimeStampedModel):
     name = models.CharField(
@@ -93,6 +159,10 @@ class Tag(UUIDModel, TimeStampedModel):
         verbose_name = _("tag")
         verbose_name_plural = _("tags")
         ordering = ["name"]
+        indexes = [
+            # Serves the case-insensitive duplicate check in TagForm
+            models.Index(Upper("name"), name="tag_name_upper_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -103,6 +173,37 @@ class Tag(UUIDModel, TimeStampedModel):
         return self.name
 
 
+class ArticleQuerySet(models.QuerySet):
+    def for_list(self):
+        """Leave out the large columns that no article listing renders."""
+        return self.defer("preview_content", "search_vector", "canonical_url")
+
+    def for_detail(self):
+        """
+        Preload what the article detail page renders.
+
+        Pages come back ordered by page number; categories and tags carry
+        only the columns the templates display.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                "pages",
+                queryset=ArticlePage.objects.only(
+                    "id",
+                    "article_id",
+                    "page_number",
+                    "title",
+                    "slug",
+                    "content",
+                    "rendered_html",
+                    "rendered_html_version",
+                ).order_by("page_number"),
+            ),
+            models.Prefetch("categories", queryset=Category.objects.only("id", "name", "slug")),
+            models.Prefetch("tags", queryset=Tag.objects.only("id", "name", "slug")),
+        )
+
+
 class Article(UUIDModel, TimeStampedModel, PublishableModel):
     title = models.CharField(
         _("title"),
@@ -199,6 +300,16 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
         null=True,
         help_text=_("Cover image for the article"),
     )
+    # Resolved on save: building it through the S3 backend signs a URL,
+    # which is too costly to repeat for every card of a listing
+    cover_image_url = models.CharField(
+        _("cover image URL"),
+        max_length=1024,
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("Public URL of the cover image"),
+    )
     cover_alt_text = models.CharField(
         _("cover alt text"),
         max_length=180,
@@ -249,13 +360,6 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
         help_text=_("Article author"),
     )
 
-    toc_json = models.TextField(
-        _("table of contents"),
-        blank=True,
-        default="",
-        help_text=_("Precomputed table of contents (JSON)"),
-    )
-
     preview_content = models.TextField(
         _("preview content"),
         blank=True,
@@ -263,18 +367,63 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
         help_text=_("Content visible before paywall"),
     )
 
+    search_vector = SearchVectorField(
+        _("search vector"),
+        null=True,
+        editable=False,
+        help_text=_("Full-text search document built from title and summary"),
+    )
+
+    # Interaction counters, maintained by signals on Clap, Like and Comment
+    claps_count = models.PositiveIntegerField(
+        _("claps count"),
+        default=0,
+        editable=False,
+        help_text=_("Number of readers who clapped"),
+    )
+    likes_count = models.PositiveIntegerField(
+        _("likes count"),
+        default=0,
+        editable=False,
+    )
+    comments_count = models.PositiveIntegerField(
+        _("comments count"),
+        default=0,
+        editable=False,
+    )
+
+    # Articles are written in several languages, so skip language-specific stemming
+    SEARCH_CONFIG = "simple"
+    COUNTER_FIELDS = ("claps_count", "likes_count", "comments_count")
+
+    objects = ArticleQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("article")
         verbose_name_plural = _("articles")
         ordering = ["-published_at", "-created_at"]
         indexes = [
             models.Index(fields=["language", "status", "access_type"]),
-            models.Index(fields=["status", "published_at"]),
+            # Public listings only ever read published rows, newest first with
+            # id as the keyset tie-breaker; drafts stay out of the index
+            models.Index(
+                fields=["-published_at", "-id"],
+                name="article_published_recent_idx",
+                condition=models.Q(status=ArticleStatus.PUBLISHED),
+            ),
+            GinIndex(fields=["search_vector"], name="article_search_vector_gin"),
+            models.Index(
+                fields=["status", "-reading_time_minutes", "-published_at"],
+                name="article_popular_idx",
+            ),
         ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._original_title = self.title if self.pk else None
+        # Read through __dict__ so instances loaded with only()/defer() don't
+        # trigger a refresh query per row for these trackers.
+        self._original_title = self.__dict__.get("title") if self.pk else None
+        self._original_status = self.__dict__.get("status") if self.pk else None
 
     def save(self, *args, **kwargs):
         # Generate slug if missing or if title has changed
@@ -286,25 +435,69 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
             self.slug = DbFunctions.generate_unique_slug(self, self.title)
         if self.access_type == ArticleAccessType.PAID and self.price is None:
             self.price = Decimal("0.00")
+        if not self._state.adding and kwargs.get("update_fields") is None and not args:
+            # The counters are bumped in SQL by signals; a full save from a
+            # stale instance must not write its old values back
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key
+                and f.name not in Article.COUNTER_FIELDS
+                and f.attname not in deferred
+            ]
         super().save(*args, **kwargs)
-        # Update tracker after save
+        # The stored file name is only final once the upload has been saved
+        update_fields = kwargs.get("update_fields")
+        if (
+            update_fields is None or "cover_image" in update_fields
+        ) and "cover_image" not in self.get_deferred_fields():
+            cover_image_url = self._resolve_cover_image_url()
+            if cover_image_url != self.cover_image_url:
+                self.cover_image_url = cover_image_url
+                Article.objects.filter(pk=self.pk).update(cover_image_url=cover_image_url)
+        # Update trackers after save (post_save handlers still see the old values)
         self._original_title = self.title
+        self._original_status = self.status
+
+    @staticmethod
+    def build_search_vector():
+        """Return the expression used to populate ``search_vector``."""
+        return SearchVector(
+            "title", weight="A", config=Article.SEARCH_CONFIG
+        ) + SearchVector("summary", weight="B", config=Article.SEARCH_CONFIG)
+
+    @staticmethod
+    def build_search_query(term: str):
+        """
+        Build a prefix-matching full-text query ("dev ops" -> "dev:* & ops:*").
+
+        Returns None when the term contains no searchable words.
+        """
+        words = re.findall(r"\w+", term)
+        if not words:
+            return None
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            config=Article.SEARCH_CONFIG,
+            search_type="raw",
+        )
 
     @property
     def is_published(self) -> bool:
         return self.status == ArticleStatus.PUBLISHED
 
     def get_cover_image_url(self) -> str:
+        """Return the cover image URL resolved on the last save, or an empty string."""
+        return self.cover_image_url
+
+    def _resolve_cover_image_url(self) -> str:
         """
-        Get the URL of the cover image safely.
+        Get the URL of the cover image from the storage backend.
         Returns the URL if the image exists, otherwise returns an empty string.
         """
-        if self.cover_image and hasattr(self.cover_image, "url"):
-            try:
-                return self.cover_image.url
-            except (ValueError, AttributeError):
-                return ""
-        return ""
+        # FieldFile.url only raises when there is no file name
+        return self.cover_image.url if self.cover_image else ""
 
     def get_absolute_url(self) -> str:
         """Return the public URL for this article's detail page."""
@@ -329,7 +522,8 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
             return data
 
         qs = (
-            Article.objects.filter(status=ArticleStatus.PUBLISHED)
+            Article.objects.for_list()
+            .filter(status=ArticleStatus.PUBLISHED)
             .prefetch_related("categories", "tags")
             .select_related("author")
             .order_by("-published_at", "-created_at")[:count]
@@ -338,6 +532,85 @@ class Article(UUIDModel, TimeStampedModel, PublishableModel):
         cache.set(LATEST_ARTICLES_CACHE_KEY, result, LATEST_ARTICLES_CACHE_TIMEOUT)
         return result
 
+    @staticmethod
+    def get_published_detail_from_cache(slug: str):
+        """
+        Return the published article for ``slug`` loaded with ``for_detail()``, or None.
+
+        A single narrow query reads the versions of the article and its pages
+        and the interaction counters; the cache key is derived from the
+        versions, so an edit moves readers to a fresh entry without explicit
+        invalidation. Category and tag changes do not touch those columns, so a
+        shared taxonomy version is part of the key as well. The counters change
+        without touching ``updated_at`` and are copied onto the cached instance.
+        """
+        row = (
+            Article.objects.filter(slug=slug, status=ArticleStatus.PUBLISHED)
+            .annotate(
+                pages_updated_at=models.Max("pages__updated_at"),
+                pages_count=models.Count("pages"),
+            )
+            .values_list(
+                "pk",
+                "updated_at",
+                "pages_updated_at",
+                "pages_count",
+                *Article.COUNTER_FIELDS,
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        pk, version, counters = row[0], row[1:4], row[4:]
+        version += (cache.get_or_set(ARTICLE_DETAIL_TAXONOMY_VERSION_KEY, 1, None),)
+        digest = hashlib.blake2b(
+            "|".join(str(v) for v in version).encode(), digest_size=12
+        ).hexdigest()
+        cache_key = f"article_detail:{pk}:{digest}"
+        article = cache.get(cache_key)
+        if article is None:
+            article = Article.objects.for_detail().filter(pk=pk).first()
+            if article is None:
+                return None
+            cache.set(cache_key, article, ARTICLE_DETAIL_CACHE_TIMEOUT)
+        for field, value in zip(Article.COUNTER_FIELDS, counters):
+            setattr(article, field, value)
+        return article
+
+    @staticmethod
+    def bump_detail_taxonomy_cache_version() -> None:
+        """Invalidate every cached article detail after a category or tag change."""
+        try:
+            cache.incr(ARTICLE_DETAIL_TAXONOMY_VERSION_KEY)
+        except ValueError:
+            cache.set(ARTICLE_DETAIL_TAXONOMY_VERSION_KEY, 1, None)
+
+    @staticmethod
+    def get_api_list_cache_key(*params) -> str:
+        """Return the cache key for one articles API listing, scoped to the current version."""
+        version = cache.get_or_set(ARTICLES_API_CACHE_VERSION_KEY, 1, None)
+        digest = hashlib.blake2b(
+            "|".join(str(p) for p in params).encode(), digest_size=12
+        ).hexdigest()
+        return f"articles_api:{version}:{digest}"
+
+    @staticmethod
+    def bump_api_list_cache_version() -> None:
+        """Invalidate every cached articles API listing at once."""
+        try:
+            cache.incr(ARTICLES_API_CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(ARTICLES_API_CACHE_VERSION_KEY, 1, None)
+
+    @staticmethod
+    def get_published_count_from_cache() -> int:
+        """Return the number of published articles, served from cache."""
+        return cache.get_or_set(
+            PUBLISHED_ARTICLES_COUNT_CACHE_KEY,
+            lambda: Article.objects.filter(status=ArticleStatus.PUBLISHED).count(),
+            PUBLISHED_ARTICLES_COUNT_CACHE_TIMEOUT,
+        )
+
     def __str__(self) -> str:
         return self.title
 
@@ -382,15 +655,27 @@ class ArticlePage(UUIDModel, TimeStampedModel):
         default="",
         help_text=_("Precomputed table of contents (JSON)"),
     )
+    # Sanitized HTML of ``content``, rendered on save so page views don't
+    # run markdown and bleach; stale when the version differs from
+    # markdown_filters.RENDER_VERSION
+    rendered_html = models.TextField(
+        _("rendered HTML"),
+        blank=True,
+        default="",
+        editable=False,
+    )
+    rendered_html_version = models.PositiveSmallIntegerField(
+        _("rendered HTML version"),
+        default=0,
+        editable=False,
+    )
 
     class Meta:
         verbose_name = _("article page")
         verbose_name_plural = _("article pages")
+        # The unique constraint's index also serves page lookups by article
         unique_together = [("article", "page_number")]
         ordering = ["article", "page_number"]
-        indexes = [
-            models.Index(fields=["article", "page_number"]),
-        ]
 
     def save(self, *args, **kwargs):
         if not self.slug and self.title:
@@ -398,11 +683,75 @@ class ArticlePage(UUIDModel, TimeStampedModel):
             self.slug = DbFunctions.generate_unique_slug_for_related_object(
                 self, self.title, related_field_name="article"
             )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.render_html()
+        elif "content" in update_fields:
+            self.render_html()
+            kwargs["update_fields"] = {*update_fields, "rendered_html", "rendered_html_version"}
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"{self.article.title} — Page {self.page_number}"
 
+    def render_html(self) -> None:
+        """Render ``content`` into ``rendered_html`` with the current pipeline."""
+        self.rendered_html = str(markdown_to_html(self.content))
+        self.rendered_html_version = RENDER_VERSION
+
+    def get_rendered_html(self) -> str:
+        """Return the page as safe HTML, rendering on the fly if the stored copy is stale."""
+        if self.rendered_html_version != RENDER_VERSION:
+            return markdown_to_html(self.content)
+        return mark_safe(self.rendered_html)
+
+    @staticmethod
+    def bulk_create_pages(article, pages, batch_size: int = 500):
+        """
+        Insert many pages of one article, then queue a single TOC rebuild.
+
+        Slugs are generated against the article's existing page slugs read
+        once, instead of a query per page. ``bulk_create`` skips ``save()``
+        and ``post_save``, so the rebuild is queued here after commit.
+        """
+        known_slugs = set(
+            ArticlePage.objects.filter(article=article).exclude(slug="").values_list("slug", flat=True)
+        )
+        for page in pages:
+            page.article = article
+            page.render_html()
+            if page.slug:
+                known_slugs.add(page.slug)
+            elif page.title:
+                page.slug = DbFunctions.generate_unique_slug_for_related_object(
+                    page, page.title, related_field_name="article", known_slugs=known_slugs
+                )
+        with transaction.atomic():
+            created = ArticlePage.objects.bulk_create(pages, batch_size=batch_size)
+            transaction.on_commit(lambda: schedule_toc_regeneration(article.pk))
+        return created
+
+    @staticmethod
+    def bulk_update_pages(article, pages, fields=("content", "title", "slug"), batch_size: int = 500):
+        """
+        Update many pages of one article, then queue a single TOC rebuild.
+
+        ``bulk_update`` does not apply ``auto_now``, so ``updated_at`` is set
+        here; the article detail cache is keyed on it.
+        """
+        fields = [*fields, "updated_at"]
+        if "content" in fields:
+            fields += ["rendered_html", "rendered_html_version"]
+        now = timezone.now()
+        for page in pages:
+            page.updated_at = now
+            if "content" in fields:
+                page.render_html()
+        with transaction.atomic():
+            updated = ArticlePage.objects.bulk_update(pages, fields, batch_size=batch_size)
+            transaction.on_commit(lambda: schedule_toc_regeneration(article.pk))
+        return updated
+
 
 class FeaturedArticles(UUIDModel, TimeStampedModel):
     """
@@ -445,61 +794,104 @@ class FeaturedArticles(UUIDModel, TimeStampedModel):
     def __str__(self) -> str:
         return str(_("Featured Articles Configuration"))
 
-    # Cache key constant
+    # Cache key constants
     CACHE_KEY = f"featured_articles:{FEATURED_ARTICLES_UUID}"
     CACHE_TIMEOUT = 60 * 60  # 1 hour
+    CONFIG_CACHE_KEY = f"featured_articles_cfg:{FEATURED_ARTICLES_UUID}"
+    CONFIG_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+    EXISTS_CACHE_KEY = f"featured_articles_exists:{FEATURED_ARTICLES_UUID}"
+    EXISTS_CACHE_TIMEOUT = 60 * 60  # 1 hour
+    CHOICES_CACHE_KEY = "featured_articles:published_choices"
+    CHOICES_CACHE_TIMEOUT = 60
+
+    @staticmethod
+    def configuration_exists() -> bool:
+        """Return whether the configuration row exists, served from cache."""
+        return cache.get_or_set(
+            FeaturedArticles.EXISTS_CACHE_KEY,
+            FeaturedArticles.objects.exists,
+            FeaturedArticles.EXISTS_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def get_featured_config():
+        """Return the singleton configuration with its articles preloaded, served from cache.
+
+        The row is seeded by a data migration, so this never writes. Returns
+        None if the row is missing (e.g. after a flush in tests).
+        """
+        config = cache.get(FeaturedArticles.CONFIG_CACHE_KEY)
+        if config is not None:
+            return config
+
+        config = (
+            FeaturedArticles.objects.select_related(
+                "first_feature", "second_feature", "third_feature"
+            )
+            .filter(pk=FEATURED_ARTICLES_UUID)
+            .first()
+        )
+        if config is not None:
+            # One categories query for all three articles rather than one per FK
+            articles = [
+                a
+                for a in (
+                    config.first_feature,
+                    config.second_feature,
+                    config.third_feature,
+                )
+                if a is not None
+            ]
+            models.prefetch_related_objects(
+                articles,
+                models.Prefetch("categories", queryset=Category.objects.only("name")),
+            )
+            cache.set(
+                FeaturedArticles.CONFIG_CACHE_KEY,
+                config,
+                FeaturedArticles.CONFIG_CACHE_TIMEOUT,
+            )
+        return config
 
     @staticmethod
     def get_featured_articles_from_cache():
         """Return a dict with keys 'first','second','third' mapping to Article instances or None.
-        Uses cache; if missing, loads from DB and caches the result.
+        Uses cache; if missing, builds it from the cached singleton configuration.
         """
         data = cache.get(FeaturedArticles.CACHE_KEY)
         if data is not None:
             return data
 
-        # Ensure the singleton exists
-        featured_config, _ = FeaturedArticles.objects.get_or_create(
-            pk=FEATURED_ARTICLES_UUID
-        )
-
-        # Collect article ids
-        ids = [
-            featured_config.first_feature.id if featured_config.first_feature else None,
-            (
-                featured_config.second_feature.id
-                if featured_config.second_feature
-                else None
-            ),
-            featured_config.third_feature.id if featured_config.third_feature else None,
-        ]
-        ids = [i for i in ids if i]
-
-        # Prefetch categories for the selected articles
-        articles_qs = Article.objects.filter(id__in=ids).prefetch_related("categories")
-        articles_map = {str(a.id): a for a in articles_qs}
+        featured_config = FeaturedArticles.get_featured_config()
+        if featured_config is None:
+            return {"first": None, "second": None, "third": None}
 
         result = {
-            "first": (
-                articles_map.get(str(featured_config.first_feature.id))
-                if featured_config.first_feature
-                else None
-            ),
-            "second": (
-                articles_map.get(str(featured_config.second_feature.id))
-                if featured_config.second_feature
-                else None
-            ),
-            "third": (
-                articles_map.get(str(featured_config.third_feature.id))
-                if featured_config.third_feature
-                else None
-            ),
+            "first": featured_config.first_feature,
+            "second": featured_config.second_feature,
+            "third": featured_config.third_feature,
         }
 
         cache.set(FeaturedArticles.CACHE_KEY, result, FeaturedArticles.CACHE_TIMEOUT)
         return result
 
+    @staticmethod
+    def get_published_choices():
+        """Return ``(pk, title)`` pairs for the featurable articles, newest first, from cache.
+
+        Shared by the three selects of the featured articles form.
+        """
+        return cache.get_or_set(
+            FeaturedArticles.CHOICES_CACHE_KEY,
+            lambda: tuple(
+                Article.objects.filter(status=ArticleStatus.PUBLISHED)
+                .order_by("-published_at")
+                .values_list("pk", "title")
+            ),
+            FeaturedArticles.CHOICES_CACHE_TIMEOUT,
+        )
+
+
 class Clap(UUIDModel, TimeStampedModel):
     """
     Model for tracking article claps/applause.
@@ -522,12 +914,13 @@ class Clap(UUIDModel, TimeStampedModel):
         related_name="article_claps",
         help_text=_("User who clapped (null for anonymous)"),
     )
+    # Looked up only together with the article, through the partial unique
+    # constraint below; a standalone index would just be written to
     session_key = models.CharField(
         _("session key"),
         max_length=40,
         blank=True,
         default="",
-        db_index=True,
         help_text=_("Session key for anonymous users"),
     )
     count = models.PositiveIntegerField(
@@ -537,13 +930,25 @@ class Clap(UUIDModel, TimeStampedModel):
         help_text=_("Number of claps (max 50 per user/session per article)"),
     )
 
+    MAX_PER_READER = 50
+
     class Meta:
         verbose_name = _("clap")
         verbose_name_plural = _("claps")
-        unique_together = [("article", "user"), ("article", "session_key")]
-        indexes = [
-            models.Index(fields=["article", "user"]),
-            models.Index(fields=["article", "session_key"]),
+        # Signed-in readers are identified by user, anonymous ones by session;
+        # authenticated rows all carry an empty session_key, so each key is
+        # only unique within its own kind of reader
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "user"],
+                condition=models.Q(user__isnull=False),
+                name="clap_unique_article_user",
+            ),
+            models.UniqueConstraint(
+                fields=["article", "session_key"],
+                condition=models.Q(user__isnull=True),
+                name="clap_unique_article_session",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -552,6 +957,44 @@ class Clap(UUIDModel, TimeStampedModel):
         )
         return f"{user_display} → {self.article.title} ({self.count})"
 
+    @staticmethod
+    def bump(article_id, user_id=None, session_key: str = ""):
+        """
+        Record one clap from a reader in a single upsert.
+
+        Readers are identified by ``user_id`` when signed in, otherwise by
+        ``session_key``. Returns ``(count, created)``, or ``(None, False)``
+        when the reader has already reached ``MAX_PER_READER``.
+
+        The upsert bypasses post_save, so a new clapper is counted on the
+        article here.
+        """
+        if user_id is not None:
+            conflict = "(article_id, user_id) WHERE user_id IS NOT NULL"
+        else:
+            conflict = "(article_id, session_key) WHERE user_id IS NULL"
+        table = Clap._meta.db_table
+        sql = f"""
+            INSERT INTO {table} (id, created_at, updated_at, article_id, user_id, session_key, count)
+            VALUES (%s, NOW(), NOW(), %s, %s, %s, 1)
+            ON CONFLICT {conflict}
+            DO UPDATE SET count = {table}.count + 1, updated_at = NOW()
+            WHERE {table}.count < %s
+            RETURNING count, (xmax = 0)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                [uuid.uuid4(), article_id, user_id, session_key, Clap.MAX_PER_READER],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None, False
+        count, created = row
+        if created:
+            Article.objects.filter(pk=article_id).update(claps_count=models.F("claps_count") + 1)
+        return count, created
+
 
 class Like(UUIDModel, TimeStampedModel):
     """
@@ -577,10 +1020,8 @@ class Like(UUIDModel, TimeStampedModel):
     class Meta:
         verbose_name = _("like")
         verbose_name_plural = _("likes")
+        # The constraint's unique index serves the (article, user) lookups
         unique_together = [("article", "user")]
-        indexes = [
-            models.Index(fields=["article", "user"]),
-        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} ❤️ {self.article.title}"
@@ -653,10 +1094,8 @@ class CommentLike(UUIDModel, TimeStampedModel):
     class Meta:
         verbose_name = _("comment like")
         verbose_name_plural = _("comment likes")
+        # The constraint's unique index serves the (comment, user) lookups
         unique_together = [("comment", "user")]
-        indexes = [
-            models.Index(fields=["comment", "user"]),
-        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} liked comment by {self.comment.user.username}"
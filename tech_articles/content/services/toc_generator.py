@@ -11,8 +11,9 @@ from django.utils.text import slugify
 class TOCGenerator:
     """Generates hierarchical TOC structure from markdown content."""
 
-    # Regex to match markdown headings: # Heading, ## Heading, etc.
-    HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+    # Regex to match a markdown heading line: # Heading, ## Heading, etc.
+    HEADING_PATTERN = re.compile(r"(#{1,6})\s+(.+)")
+    FENCE_MARKERS = ("```", "~~~")
 
     @classmethod
     def generate_from_article(cls, article) -> List[Dict]:
@@ -31,9 +32,11 @@ class TOCGenerator:
         """
         all_headings = []
 
-        for page in article.pages.all().order_by("page_number"):
-            headings = cls._extract_headings(page.content, page.page_number)
-            all_headings.extend(headings)
+        # Only two columns are read, so skip building ArticlePage instances;
+        # stream the rows so long articles aren't held in memory at once
+        pages = article.pages.order_by("page_number").values_list("content", "page_number")
+        for content, page_number in pages.iterator(chunk_size=20):
+            all_headings.extend(cls._extract_headings(content, page_number))
 
         return cls._build_hierarchy(all_headings)
 
@@ -41,34 +44,44 @@ class TOCGenerator:
     def _extract_headings(cls, markdown_text: str, page_number: int = 1) -> List[Dict]:
         """Extract all headings from markdown text.
 
-        This method first strips fenced code blocks (``` ``` and ~~~ ~~~) and
-        indented code blocks (lines starting with 4 spaces) to avoid picking
-        up lines that look like headings inside code samples.
+        Lines are scanned once; lines inside fenced code blocks (``` ``` and
+        ~~~ ~~~) and indented code lines (starting with 4 spaces) are skipped
+        to avoid picking up lines that look like headings inside code samples.
         """
         if not markdown_text:
             return []
 
-        # Remove fenced code blocks using ``` ``` and ~~~ ~~~ (DOTALL / non-greedy)
-        cleaned = re.sub(r"```[\s\S]*?```", "", markdown_text)
-        cleaned = re.sub(r"~~~[\s\S]*?~~~", "", cleaned)
-
-        # Remove indented code blocks (lines starting with 4 spaces)
-        # Match one or more consecutive lines that start with 4 spaces
-        cleaned = re.sub(r"(?m)^(?: {4}.*\n?)+", "", cleaned)
-
         headings: List[Dict] = []
-        matches = cls.HEADING_PATTERN.finditer(cleaned)
-
-        for match in matches:
+        fence = None
+
+        for line in markdown_text.splitlines():
+            if fence is not None:
+                if fence in line and line.lstrip().startswith(fence):
+                    fence = None
+                continue
+            # Plain text lines can't open a fence or be a heading
+            if not line or line[0] not in "#`~ \t":
+                continue
+            stripped = line.lstrip()
+            marker = stripped[:3]
+            if marker in cls.FENCE_MARKERS and marker[0] not in stripped[3:]:
+                # Opening fence; ```code``` on one line is inline code instead
+                fence = marker
+                continue
+            if line.startswith("    "):
+                continue
+
+            match = cls.HEADING_PATTERN.match(line)
+            if not match:
+                continue
             hashes, text = match.groups()
-            level = len(hashes)
-            heading_id = slugify(text)
+            text = text.strip()
 
             headings.append(
                 {
-                    "id": heading_id,
-                    "text": text.strip(),
-                    "level": level,
+                    "id": slugify(text),
+                    "text": text,
+                    "level": len(hashes),
                     "page_number": page_number,
                     "children": [],
                 }
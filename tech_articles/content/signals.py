@@ -1,9 +1,15 @@
 from django.core.cache import cache
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_save, post_delete
 from django.dispatch import receiver
 
-from tech_articles.content.models import FeaturedArticles, TableOfContents, ArticlePage, LATEST_ARTICLES_CACHE_KEY, \
-    Article
+from tech_articles.content.models import FeaturedArticles, ArticlePage, Clap, Comment, Like, LATEST_ARTICLES_CACHE_KEY, \
+    Article, Category, PUBLISHED_ARTICLES_COUNT_CACHE_KEY, ACTIVE_CATEGORIES_API_CACHE_KEY, \
+    ACTIVE_CATEGORY_CHOICES_CACHE_KEY, Tag
+from tech_articles.content.tasks import schedule_toc_regeneration
+from tech_articles.utils.enums import ArticleStatus
 from tech_articles.utils.constants import FEATURED_ARTICLES_UUID
 
 CACHE_KEY = f"featured_articles:{FEATURED_ARTICLES_UUID}"
@@ -23,18 +29,30 @@ def clear_featured_cache_on_delete(sender, instance, **kwargs):
 
 @receiver(post_save, sender=FeaturedArticles)
 def clear_featured_articles_cache_on_save(sender, instance, **kwargs):
-    """Clear the featured articles cache when the configuration changes."""
+    """Clear the featured articles caches when the configuration changes."""
     try:
-        cache.delete(FeaturedArticles.CACHE_KEY)
+        cache.delete_many(
+            [
+                FeaturedArticles.CACHE_KEY,
+                FeaturedArticles.CONFIG_CACHE_KEY,
+                FeaturedArticles.EXISTS_CACHE_KEY,
+            ]
+        )
     except Exception:
         pass
 
 
 @receiver(post_delete, sender=FeaturedArticles)
 def clear_featured_articles_cache_on_delete(sender, instance, **kwargs):
-    """Clear cache when the FeaturedArticles instance is deleted."""
+    """Clear caches when the FeaturedArticles instance is deleted."""
     try:
-        cache.delete(FeaturedArticles.CACHE_KEY)
+        cache.delete_many(
+            [
+                FeaturedArticles.CACHE_KEY,
+                FeaturedArticles.CONFIG_CACHE_KEY,
+                FeaturedArticles.EXISTS_CACHE_KEY,
+            ]
+        )
     except Exception:
         pass
 
@@ -42,17 +60,9 @@ def clear_featured_articles_cache_on_delete(sender, instance, **kwargs):
 
 @receiver(post_save, sender=ArticlePage)
 def auto_generate_toc(sender, instance, **kwargs):
-    """Auto-generate TOC when article page is saved."""
-    from tech_articles.content.services.toc_generator import TOCGenerator
-
-    try:
-        toc = TableOfContents.objects.get(article=instance.article)
-        if toc.is_auto_generated:
-            structure = TOCGenerator.generate_from_article(instance.article)
-            toc.structure = structure
-            toc.save(update_fields=["structure", "updated_at"])
-    except TableOfContents.DoesNotExist:
-        pass
+    """Queue an auto-generated TOC rebuild once the page save commits."""
+    article_id = instance.article_id
+    transaction.on_commit(lambda: schedule_toc_regeneration(article_id))
 
 
 @receiver(post_save, sender=Article)
@@ -73,4 +83,115 @@ def clear_latest_articles_cache_on_delete(sender, instance, **kwargs):
         pass
 
 
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def clear_featured_choices_cache(sender, **kwargs):
+    """Drop the cached featured-article choices when any Article changes."""
+    try:
+        cache.delete(FeaturedArticles.CHOICES_CACHE_KEY)
+    except Exception:
+        pass
+
+
+@receiver(post_save, sender=Article)
+def clear_published_count_cache_on_save(sender, instance, created, **kwargs):
+    """Invalidate the published-articles count when an Article enters or leaves PUBLISHED."""
+    previous_status = None if created else getattr(instance, "_original_status", None)
+    if previous_status == instance.status:
+        return
+    if ArticleStatus.PUBLISHED in (previous_status, instance.status):
+        try:
+            cache.delete(PUBLISHED_ARTICLES_COUNT_CACHE_KEY)
+        except Exception:
+            pass
+
+
+@receiver(post_delete, sender=Article)
+def clear_published_count_cache_on_delete(sender, instance, **kwargs):
+    """Invalidate the published-articles count when a published Article is deleted."""
+    if instance.status == ArticleStatus.PUBLISHED:
+        try:
+            cache.delete(PUBLISHED_ARTICLES_COUNT_CACHE_KEY)
+        except Exception:
+            pass
+
+
+@receiver(post_save, sender=Article)
+def update_article_search_vector(sender, instance, update_fields=None, **kwargs):
+    """Refresh the full-text search document when the title or summary may have changed."""
+    if update_fields is not None and not {"title", "summary"} & set(update_fields):
+        return
+    Article.objects.filter(pk=instance.pk).update(
+        search_vector=Article.build_search_vector()
+    )
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=FeaturedArticles)
+@receiver(m2m_changed, sender=Article.categories.through)
+def bump_articles_api_cache_version(sender, **kwargs):
+    """Invalidate cached articles API listings whenever their inputs change."""
+    try:
+        Article.bump_api_list_cache_version()
+    except Exception:
+        pass
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Article.categories.through)
+@receiver(m2m_changed, sender=Article.tags.through)
+def bump_article_detail_taxonomy_version(sender, **kwargs):
+    """Invalidate cached article details, which carry their categories and tags."""
+    try:
+        Article.bump_detail_taxonomy_cache_version()
+    except Exception:
+        pass
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_active_categories_api_cache(sender, **kwargs):
+    """Drop the cached active categories (API payload and form choices) when any category changes."""
+    try:
+        cache.delete_many([ACTIVE_CATEGORIES_API_CACHE_KEY, ACTIVE_CATEGORY_CHOICES_CACHE_KEY])
+    except Exception:
+        pass
+
 
+# Article counter column kept in step with each interaction model
+ARTICLE_COUNTER_FIELDS = {
+    Clap: "claps_count",
+    Like: "likes_count",
+    Comment: "comments_count",
+}
+
+
+@receiver(post_save, sender=Clap)
+@receiver(post_save, sender=Like)
+@receiver(post_save, sender=Comment)
+def increment_article_counter(sender, instance, created, **kwargs):
+    """Count a new interaction on its article with an in-place UPDATE."""
+    if created:
+        field = ARTICLE_COUNTER_FIELDS[sender]
+        Article.objects.filter(pk=instance.article_id).update(**{field: F(field) + 1})
+
+
+@receiver(post_delete, sender=Clap)
+@receiver(post_delete, sender=Like)
+@receiver(post_delete, sender=Comment)
+def decrement_article_counter(sender, instance, **kwargs):
+    """Uncount a removed interaction, never going below zero."""
+    origin = kwargs.get("origin")
+    if isinstance(origin, Article) or getattr(origin, "model", None) is Article:
+        # Cascading from the article's own delete; there is no row left to update
+        return
+    field = ARTICLE_COUNTER_FIELDS[sender]
+    Article.objects.filter(pk=instance.article_id).update(
+        **{field: Greatest(F(field) - 1, Value(0))}
+    )
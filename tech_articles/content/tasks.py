@@ -0,0 +1,65 @@
+"""
+Content tasks run outside the request cycle.
+"""
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Page saves within this window share one TOC rebuild
+TOC_DEBOUNCE_SECONDS = 5
+
+
+def schedule_toc_regeneration(article_id) -> None:
+    """
+    Queue a TOC rebuild for an article, coalescing bursts of page saves.
+
+    The first call in a window queues the task with a countdown equal to
+    the window. Later calls in the same window are dropped, because that
+    task runs after their changes are committed.
+    """
+    if cache.add(f"toc:debounce:{article_id}", True, TOC_DEBOUNCE_SECONDS):
+        regenerate_article_toc.apply_async(args=[str(article_id)], countdown=TOC_DEBOUNCE_SECONDS)
+
+
+@shared_task
+def regenerate_article_toc(article_id: str):
+    """Rebuild an article's auto-generated table of contents from its pages."""
+    from tech_articles.content.models import TableOfContents
+    from tech_articles.content.services.toc_generator import TOCGenerator
+
+    toc = TableOfContents.objects.select_related("article").filter(article_id=article_id).first()
+    if toc is None or not toc.is_auto_generated:
+        return
+    structure = TOCGenerator.generate_from_article(toc.article)
+    if structure == toc.structure:
+        # Page edits that leave the headings alone need no write
+        return
+    toc.structure = structure
+    toc.save(update_fields=["structure", "updated_at"])
+    logger.info("Regenerated TOC for article %s", article_id)
+
+
+@shared_task
+def rerender_stale_article_pages(batch_size: int = 200):
+    """Re-render stored page HTML produced by an older markdown pipeline."""
+    from tech_articles.content.models import ArticlePage
+    from tech_articles.content.templatetags.markdown_filters import RENDER_VERSION
+
+    total = 0
+    while True:
+        pages = list(
+            ArticlePage.objects.exclude(rendered_html_version=RENDER_VERSION).only(
+                "pk", "content"
+            )[:batch_size]
+        )
+        if not pages:
+            break
+        for page in pages:
+            page.render_html()
+        ArticlePage.objects.bulk_update(pages, ["rendered_html", "rendered_html_version"])
+        total += len(pages)
+    logger.info("Re-rendered %s article pages", total)
+    return total
@@ -0,0 +1,395 @@
+"""
+Tests for content signals and tasks.
+"""
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.safestring import SafeString
+
+from tech_articles.content.forms.featured_articles_forms import FEATURE_FIELDS, FeaturedArticlesForm
+from tech_articles.content.models import (
+    Article,
+    ArticlePage,
+    Category,
+    Clap,
+    Comment,
+    FeaturedArticles,
+    Like,
+    TableOfContents,
+    Tag,
+)
+from tech_articles.content.services.toc_generator import TOCGenerator
+from tech_articles.content.templatetags.markdown_filters import markdown_to_html
+from tech_articles.content.tasks import regenerate_article_toc, rerender_stale_article_pages
+from tech_articles.utils.enums import ArticleStatus
+
+User = get_user_model()
+
+
+class ArticleTocRegenerationTest(TestCase):
+    """Test cases for the debounced TOC rebuild on page saves."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(email="toc@example.com", password="testpass123")
+        self.article = Article.objects.create(title="TOC Article", author=self.author)
+        self.toc = TableOfContents.objects.create(article=self.article, structure=[])
+
+    def test_page_saves_queue_one_rebuild_after_commit(self):
+        with mock.patch.object(regenerate_article_toc, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                page = ArticlePage.objects.create(article=self.article, page_number=1, content="# One")
+                page.content = "# One\n## Two"
+                page.save()
+        apply_async.assert_called_once_with(args=[str(self.article.pk)], countdown=mock.ANY)
+
+    def test_task_rebuilds_auto_generated_toc(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            ArticlePage.objects.create(article=self.article, page_number=1, content="# Heading")
+        regenerate_article_toc(str(self.article.pk))
+        self.toc.refresh_from_db()
+        self.assertEqual(self.toc.structure[0]["text"], "Heading")
+
+    def test_task_skips_unchanged_toc(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            ArticlePage.objects.create(article=self.article, page_number=1, content="# Heading")
+        regenerate_article_toc(str(self.article.pk))
+        self.toc.refresh_from_db()
+        updated_at = self.toc.updated_at
+        regenerate_article_toc(str(self.article.pk))
+        self.toc.refresh_from_db()
+        self.assertEqual(self.toc.updated_at, updated_at)
+
+    def test_task_leaves_manual_toc_alone(self):
+        TableOfContents.objects.filter(pk=self.toc.pk).update(is_auto_generated=False)
+        with self.captureOnCommitCallbacks(execute=False):
+            ArticlePage.objects.create(article=self.article, page_number=1, content="# Heading")
+        regenerate_article_toc(str(self.article.pk))
+        self.toc.refresh_from_db()
+        self.assertEqual(self.toc.structure, [])
+
+
+class ArticleCounterTest(TestCase):
+    """Test cases for the denormalized interaction counters on Article."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(email="counts@example.com", password="testpass123")
+        self.reader = User.objects.create_user(email="reader@example.com", password="testpass123")
+        self.article = Article.objects.create(title="Counted", author=self.author)
+
+    def test_counters_follow_interactions(self):
+        like = Like.objects.create(article=self.article, user=self.reader)
+        Clap.objects.create(article=self.article, user=self.reader, count=3)
+        Comment.objects.create(article=self.article, user=self.reader, content="Nice")
+        self.article.refresh_from_db()
+        self.assertEqual(
+            (self.article.claps_count, self.article.likes_count, self.article.comments_count),
+            (1, 1, 1),
+        )
+
+        like.delete()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.likes_count, 0)
+
+    def test_article_delete_skips_counter_updates(self):
+        Like.objects.create(article=self.article, user=self.reader)
+        Comment.objects.create(article=self.article, user=self.reader, content="Nice")
+        with CaptureQueriesContext(connection) as ctx:
+            self.article.delete()
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "content_article"')]
+        self.assertEqual(updates, [])
+
+    def test_user_delete_uncounts_interactions(self):
+        Like.objects.create(article=self.article, user=self.reader)
+        self.reader.delete()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.likes_count, 0)
+
+    def test_full_save_keeps_counters(self):
+        stale = Article.objects.get(pk=self.article.pk)
+        Like.objects.create(article=self.article, user=self.reader)
+        stale.title = "Renamed"
+        stale.save()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, "Renamed")
+        self.assertEqual(self.article.likes_count, 1)
+
+
+class ArticleClapApiTest(TestCase):
+    """Test cases for the clap upsert endpoint."""
+
+    def setUp(self):
+        author = User.objects.create_user(email="clapped@example.com", password="testpass123")
+        self.article = Article.objects.create(
+            title="Clap Target",
+            author=author,
+            status=ArticleStatus.PUBLISHED,
+            published_at=timezone.now(),
+        )
+        self.url = reverse("content:api_article_clap", kwargs={"article_id": self.article.pk})
+
+    def test_signed_in_readers_clap_independently(self):
+        for email in ("one@example.com", "two@example.com"):
+            self.client.force_login(User.objects.create_user(email=email, password="testpass123"))
+            response = self.client.post(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["count"], 1)
+        self.assertEqual(response.json()["total"], 2)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.claps_count, 2)
+
+    def test_claps_capped_per_reader(self):
+        Clap.objects.create(article=self.article, session_key="", user=None, count=1)
+        self.client.force_login(User.objects.create_user(email="fan@example.com", password="testpass123"))
+        for expected in range(1, Clap.MAX_PER_READER + 1):
+            self.assertEqual(self.client.post(self.url).json()["count"], expected)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["count"], Clap.MAX_PER_READER)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.claps_count, 2)
+
+    def test_anonymous_reader_tracked_by_session(self):
+        self.client.post(self.url)
+        response = self.client.post(self.url)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(Clap.objects.get(article=self.article).session_key, self.client.session.session_key)
+
+
+class ArticleCoverImageUrlTest(TestCase):
+    """Test cases for the cover image URL resolved on save."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(email="cover@example.com", password="testpass123")
+        self.article = Article.objects.create(title="Cover Article", author=self.author)
+
+    def test_url_follows_cover_image(self):
+        self.assertEqual(self.article.get_cover_image_url(), "")
+
+        self.article.cover_image = "articles/covers/cover.png"
+        self.article.save()
+        stored = Article.objects.values_list("cover_image_url", flat=True).get(pk=self.article.pk)
+        self.assertEqual(stored, self.article.cover_image.url)
+        self.assertEqual(self.article.get_cover_image_url(), stored)
+
+        self.article.cover_image = None
+        self.article.save()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.cover_image_url, "")
+
+
+class ArticleForDetailTest(TestCase):
+    """Test cases for the detail page preloading."""
+
+    def test_pages_categories_and_tags_are_preloaded(self):
+        author = User.objects.create_user(email="detail@example.com", password="testpass123")
+        article = Article.objects.create(title="Detail Article", author=author)
+        ArticlePage.objects.create(article=article, page_number=2, content="Two")
+        ArticlePage.objects.create(article=article, page_number=1, content="One")
+
+        article = Article.objects.for_detail().get(pk=article.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual([p.page_number for p in article.pages.all()], [1, 2])
+            self.assertEqual(list(article.categories.all()), [])
+            self.assertEqual(list(article.tags.all()), [])
+
+
+class ArticleDetailCacheTest(TestCase):
+    """Test cases for the versioned article detail cache."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(email="cached@example.com", password="testpass123")
+        self.article = Article.objects.create(
+            title="Cached Article",
+            author=self.author,
+            status=ArticleStatus.PUBLISHED,
+            published_at=timezone.now(),
+        )
+        ArticlePage.objects.create(article=self.article, page_number=1, content="First")
+
+    def test_cached_until_article_or_pages_change(self):
+        Article.get_published_detail_from_cache(self.article.slug)
+        with self.assertNumQueries(1):
+            article = Article.get_published_detail_from_cache(self.article.slug)
+            self.assertEqual([p.content for p in article.pages.all()], ["First"])
+
+        ArticlePage.objects.create(article=self.article, page_number=2, content="Second")
+        article = Article.get_published_detail_from_cache(self.article.slug)
+        self.assertEqual([p.content for p in article.pages.all()], ["First", "Second"])
+
+        self.article.title = "Renamed Article"
+        self.article.save()
+        article = Article.get_published_detail_from_cache(self.article.slug)
+        self.assertEqual(article.title, "Renamed Article")
+
+    def test_cached_until_categories_or_tags_change(self):
+        category = Category.objects.create(name="Before", is_active=True)
+        tag = Tag.objects.create(name="Old tag")
+        self.article.categories.add(category)
+        self.article.tags.add(tag)
+        Article.get_published_detail_from_cache(self.article.slug)
+
+        category.name = "After"
+        category.save()
+        article = Article.get_published_detail_from_cache(self.article.slug)
+        self.assertEqual([c.name for c in article.categories.all()], ["After"])
+
+        tag.delete()
+        article = Article.get_published_detail_from_cache(self.article.slug)
+        self.assertEqual(list(article.tags.all()), [])
+
+    def test_counters_are_read_fresh(self):
+        Article.get_published_detail_from_cache(self.article.slug)
+        Article.objects.filter(pk=self.article.pk).update(claps_count=7)
+        article = Article.get_published_detail_from_cache(self.article.slug)
+        self.assertEqual(article.claps_count, 7)
+
+    def test_unpublished_article_is_not_served(self):
+        Article.get_published_detail_from_cache(self.article.slug)
+        self.article.status = ArticleStatus.DRAFT
+        self.article.save()
+        self.assertIsNone(Article.get_published_detail_from_cache(self.article.slug))
+
+
+class ArticlePageBulkTest(TestCase):
+    """Test cases for the bulk page import helpers."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(email="bulk@example.com", password="testpass123")
+        self.article = Article.objects.create(title="Bulk Article", author=self.author)
+        ArticlePage.objects.create(article=self.article, page_number=1, title="Intro", content="# Intro")
+
+    def test_bulk_create_pages_queues_one_rebuild(self):
+        pages = [
+            ArticlePage(page_number=n, title="Intro", content=f"# Part {n}")
+            for n in range(2, 5)
+        ]
+        with mock.patch.object(regenerate_article_toc, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                ArticlePage.bulk_create_pages(self.article, pages)
+        apply_async.assert_called_once()
+        slugs = list(self.article.pages.values_list("slug", flat=True))
+        self.assertEqual(len(slugs), 4)
+        self.assertEqual(len(set(slugs)), 4)
+
+    def test_bulk_update_pages_touches_updated_at(self):
+        page = self.article.pages.get()
+        before = page.updated_at
+        page.content = "# Changed"
+        with mock.patch.object(regenerate_article_toc, "apply_async"):
+            with self.captureOnCommitCallbacks(execute=True):
+                ArticlePage.bulk_update_pages(self.article, [page], fields=["content"])
+        page.refresh_from_db()
+        self.assertEqual(page.content, "# Changed")
+        self.assertGreater(page.updated_at, before)
+
+
+class TOCGeneratorTest(TestCase):
+    """Test cases for heading extraction."""
+
+    def test_headings_in_code_are_skipped(self):
+        text = "# Title\n```python\n# comment\n```\n    # indented\n~~~\n## Hidden\n~~~\n## Section\n"
+        headings = TOCGenerator._extract_headings(text, page_number=3)
+        self.assertEqual([(h["text"], h["level"]) for h in headings], [("Title", 1), ("Section", 2)])
+        self.assertEqual(headings[1]["id"], "section")
+        self.assertEqual(headings[1]["page_number"], 3)
+
+
+class ArticlePageRenderedHtmlTest(TestCase):
+    """Test cases for the HTML stored on article pages."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(email="render@example.com", password="testpass123")
+        self.article = Article.objects.create(title="Rendered Article", author=self.author)
+        self.page = ArticlePage.objects.create(article=self.article, page_number=1, content="**bold**")
+
+    def test_html_rendered_on_save(self):
+        self.page.refresh_from_db()
+        self.assertIn("<strong>bold</strong>", self.page.rendered_html)
+
+        self.page.content = "*italic*"
+        self.page.save(update_fields=["content"])
+        self.page.refresh_from_db()
+        self.assertIn("<em>italic</em>", self.page.get_rendered_html())
+
+    def test_stale_html_is_rendered_live_then_backfilled(self):
+        ArticlePage.objects.filter(pk=self.page.pk).update(rendered_html="old", rendered_html_version=0)
+        self.page.refresh_from_db()
+        self.assertIn("<strong>bold</strong>", self.page.get_rendered_html())
+
+        self.assertEqual(rerender_stale_article_pages(), 1)
+        self.page.refresh_from_db()
+        self.assertIn("<strong>bold</strong>", self.page.rendered_html)
+
+
+class MarkdownToHtmlTest(TestCase):
+    """Test cases for the markdown rendering pipeline."""
+
+    def test_bare_urls_are_linked_outside_code(self):
+        html = markdown_to_html("See https://example.com/a_b, or www.example.org.\n\n`https://code.example.com`")
+        self.assertIn('<a href="https://example.com/a_b" rel="nofollow">https://example.com/a_b</a>,', html)
+        self.assertIn('<a href="http://www.example.org" rel="nofollow">www.example.org</a>.', html)
+        self.assertIn("<code>https://code.example.com</code>", html)
+
+    def test_bare_urls_next_to_raw_html(self):
+        html = markdown_to_html("Visit <span>https://x.com</span>")
+        self.assertIn('<span><a href="https://x.com" rel="nofollow">https://x.com</a></span>', html)
+
+    def test_urls_inside_raw_links_are_left_alone(self):
+        html = markdown_to_html('Visit <a href="https://x.com">https://x.com</a>')
+        self.assertIn('Visit <a href="https://x.com" rel="nofollow">https://x.com</a></p>', html)
+        self.assertEqual(html.count("<a "), 1)
+
+    def test_cached_render_stays_safe(self):
+        cache.clear()
+        first = markdown_to_html("**cached**")
+        with mock.patch("tech_articles.content.templatetags.markdown_filters._render_html") as render:
+            second = markdown_to_html("**cached**")
+        render.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsInstance(second, SafeString)
+
+    def test_unsafe_markup_is_removed(self):
+        html = markdown_to_html('<script>alert(1)</script>[x](javascript:alert(1)) <img src="a.png" onerror="x">')
+        self.assertNotIn("script", html)
+        self.assertNotIn("javascript", html)
+        self.assertNotIn("onerror", html)
+
+
+class FeaturedArticlesFormTest(TestCase):
+    """Test cases for the dashboard featured articles form."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(email="featured-form@example.com", password="testpass123")
+        self.articles = [
+            Article.objects.create(
+                title=f"Pick {i}",
+                author=self.author,
+                status=ArticleStatus.PUBLISHED,
+                published_at=timezone.now(),
+            )
+            for i in range(3)
+        ]
+
+    def test_three_picks_validate_in_one_query(self):
+        data = dict(zip(FEATURE_FIELDS, (str(a.pk) for a in self.articles)))
+        form = FeaturedArticlesForm(data=data, instance=FeaturedArticles.get_featured_config())
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["third_feature"], self.articles[2])
+
+    def test_unpublished_pick_is_rejected(self):
+        Article.objects.filter(pk=self.articles[0].pk).update(status=ArticleStatus.DRAFT)
+        data = dict(zip(FEATURE_FIELDS, (str(a.pk) for a in self.articles)))
+        form = FeaturedArticlesForm(data=data, instance=FeaturedArticles.get_featured_config())
+        self.assertFalse(form.is_valid())
+        self.assertIn("first_feature", form.errors)
@@ -9,19 +9,27 @@ This module contains views for:
 - Article-related API endpoints (list, featured, related, categories)
 """
 
+import base64
+import json
 import logging
-import math
+import uuid
+from collections import defaultdict
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
 from django.db import models
-from django.db.models import Q
-from django.http import JsonResponse
+from django.db.models import Exists, F, OuterRef, Q
+from django.http import HttpResponse, JsonResponse
+from django.utils.dateparse import parse_datetime
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.http import condition
 from django.views.generic import TemplateView
 
 from tech_articles.analytics.services import ReadingTracker
 from tech_articles.billing.models import Purchase
 from tech_articles.content.models import (
+    ARTICLES_API_CACHE_TIMEOUT,
     Article,
     Category,
     Clap,
@@ -31,10 +39,36 @@ from tech_articles.content.models import (
     Like,
     TableOfContents,
 )
+from tech_articles.utils.db_functions import DbFunctions
 from tech_articles.utils.enums import ArticleStatus, ArticleAccessType, PaymentStatus
+from tech_articles.utils.http import dumps_json, orjson_response
 
 logger = logging.getLogger(__name__)
 
+# Columns serialized by the list endpoints; they are read with values(), so
+# wide text columns (preview_content, search_vector, SEO fields)
+# and model instantiation stay off the hot path.
+ARTICLE_LIST_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "summary",
+    "language",
+    "reading_time_minutes",
+    "cover_image_url",
+    "cover_alt_text",
+    "access_type",
+    "difficulty",
+    "published_at",
+)
+RELATED_ARTICLE_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "summary",
+    "reading_time_minutes",
+)
+
 
 def _serialize_article(article, fields=None):
     """Serialize an Article instance to a JSON-safe dict.
@@ -47,9 +81,10 @@ def _serialize_article(article, fields=None):
     Returns:
         Dictionary containing serialized article data.
     """
-    categories = list(article.categories.values_list("name", flat=True))
+    # Read from the prefetch cache; values_list() would bypass it and query per article
+    categories = [c.name for c in article.categories.all()]
     all_fields = {
-        "id": str(article.id),
+        "id": article.id,
         "title": article.title,
         "slug": article.slug,
         "summary": article.summary,
@@ -60,15 +95,74 @@ def _serialize_article(article, fields=None):
         "access_type": article.access_type,
         "difficulty": article.difficulty,
         "categories": categories,
-        "published_at": (
-            article.published_at.isoformat() if article.published_at else None
-        ),
+        "published_at": article.published_at,
     }
     if fields is None:
         return all_fields
     return {k: v for k, v in all_fields.items() if k in fields}
 
 
+def _serialize_article_rows(rows):
+    """Serialize ``values()`` rows of Article to JSON-safe dicts.
+
+    Category names for every row are loaded with a single query on the
+    article/category join table instead of per-instance prefetching.
+
+    Args:
+        rows: List of dicts produced by ``Article.objects.values(...)``.
+              Must include ``id``.
+
+    Returns:
+        List of dictionaries with the same keys as ``_serialize_article``.
+    """
+    if not rows:
+        return []
+
+    category_names = defaultdict(list)
+    pairs = (
+        Article.categories.through.objects.filter(
+            article_id__in=[row["id"] for row in rows]
+        )
+        .order_by("category__sort_order", "category__name")
+        .values_list("article_id", "category__name")
+    )
+    for article_id, name in pairs:
+        category_names[article_id].append(name)
+
+    result = []
+    for row in rows:
+        data = dict(row)
+        data["categories"] = category_names.get(row["id"], [])
+        result.append(data)
+    return result
+
+
+def _encode_cursor(published_at, article_id):
+    """Encode a ``(published_at, id)`` keyset position as an opaque cursor."""
+    raw = json.dumps(
+        [published_at.isoformat() if published_at else None, str(article_id)]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(value):
+    """Decode a cursor produced by ``_encode_cursor``.
+
+    Returns:
+        A ``(published_at, id)`` tuple, or ``None`` if the cursor is malformed.
+        ``published_at`` is ``None`` for a position among undated articles.
+    """
+    try:
+        raw_published_at, article_id = json.loads(base64.urlsafe_b64decode(value.encode()))
+        published_at = None if raw_published_at is None else parse_datetime(raw_published_at)
+        article_id = uuid.UUID(article_id)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if raw_published_at is not None and published_at is None:
+        return None
+    return published_at, article_id
+
+
 class ArticlesListView(TemplateView):
     """Articles listing page with lazy-loaded dynamic content."""
 
@@ -103,15 +197,14 @@ class ArticleDetailView(TemplateView):
 
     def get_article(self):
         """Get article by slug from URL or return None."""
+        # Called for both the template choice and the context: load it once
+        if hasattr(self, "_article"):
+            return self._article
+        self._article = None
         slug = self.request.GET.get("slug") or self.kwargs.get("slug")
-        if not slug:
-            return None
-        try:
-            return Article.objects.prefetch_related("categories", "tags", "pages").get(
-                slug=slug, status=ArticleStatus.PUBLISHED
-            )
-        except Article.DoesNotExist:
-            return None
+        if slug:
+            self._article = Article.get_published_detail_from_cache(slug)
+        return self._article
 
     def user_has_access(self, article):
         """
@@ -168,10 +261,10 @@ class ArticleDetailView(TemplateView):
         except Exception:
             context["featured_map"] = {"first": None, "second": None, "third": None}
 
-        # Get interaction counts
-        context["clap_count"] = Clap.objects.filter(article=article).count()
-        context["like_count"] = Like.objects.filter(article=article).count()
-        context["comment_count"] = Comment.objects.filter(article=article).count()
+        # Interaction counts are stored on the article row
+        context["clap_count"] = article.claps_count
+        context["like_count"] = article.likes_count
+        context["comment_count"] = article.comments_count
 
         # Check if current user has liked (for authenticated users)
         context["user_has_liked"] = False
@@ -186,7 +279,8 @@ class ArticleDetailView(TemplateView):
             context["user_liked_comment_ids"] = set(liked_ids)
 
         # Pagination logic for multi-page articles
-        pages = list(article.pages.all().order_by("page_number"))
+        # Prefetched in page order; re-ordering here would query again
+        pages = list(article.pages.all())
         total_pages = len(pages)
 
         # Get current page number from query param (default to 1)
@@ -270,89 +364,223 @@ class ArticlesApiView(View):
 
     Query parameters:
       - page (int): page number (default 1)
-      - search (str): search term for title/summary
+      - cursor (str): opaque keyset cursor returned as ``next_cursor``; only
+        honoured for the 'recent' and 'oldest' sorts
+      - search (str): full-text prefix search over title/summary
       - sort (str): 'recent' | 'oldest' | 'popular' (default 'recent')
       - categories (str): comma-separated category IDs (UUIDs)
     """
 
     http_method_names = ["get"]
     ARTICLES_PER_PAGE = 6
+    # Sorts backed by article_published_recent_idx (read backwards for
+    # "oldest") that support keyset pagination; "popular" has no monotonic
+    # key and stays on OFFSET paging. Published articles may be undated:
+    # they come first in "recent" and last in "oldest", as in the index.
+    KEYSET_ORDERINGS = {
+        "recent": (F("published_at").desc(nulls_first=True), F("id").desc()),
+        "oldest": (F("published_at").asc(nulls_last=True), F("id").asc()),
+    }
+    # Upper bound on rows counted for filtered listings; past this the
+    # total falls back to the planner estimate and has_next comes from the
+    # lookahead row.
+    MAX_COUNTED_RESULTS = 600
 
     def get(self, request):
-        qs = Article.objects.filter(
-            status=ArticleStatus.PUBLISHED,
-        ).prefetch_related("categories")
+        # Check if we have active filters
+        search = request.GET.get("search", "").strip()
+        category_param = request.GET.get("categories", "").strip()
+        sort = request.GET.get("sort", "recent")
+        cursor_param = request.GET.get("cursor", "")
+
+        try:
+            page = int(request.GET.get("page", 1))
+        except (ValueError, TypeError):
+            page = 1
+
+        # Category filter: parse UUIDs once up front so malformed ids are
+        # dropped here instead of raising ValidationError inside the query
+        category_ids = []
+        if category_param:
+            for cid in category_param.split(","):
+                try:
+                    category_ids.append(uuid.UUID(cid.strip()))
+                except ValueError:
+                    continue
+            if not category_ids:
+                return JsonResponse({"error": "Invalid category filter"}, status=400)
+
+        # Identical listings are served as pre-serialized JSON until the
+        # namespace version is bumped by an article/category/featured change
+        cache_key = Article.get_api_list_cache_key(
+            page, search, sort, ",".join(sorted(map(str, category_ids))), cursor_param
+        )
+        body = cache.get(cache_key)
+        if body is None:
+            payload = self._build_payload(search, sort, category_ids, page, cursor_param)
+            body = dumps_json(payload)
+            cache.set(cache_key, body, ARTICLES_API_CACHE_TIMEOUT)
+        return HttpResponse(body, content_type="application/json")
+
+    def _build_payload(self, search, sort, category_ids, page, cursor_param):
+        """Query and serialize one page of the listing."""
+        qs = Article.objects.filter(status=ArticleStatus.PUBLISHED)
 
         # Get featured article IDs to exclude
         try:
             featured_map = FeaturedArticles.get_featured_articles_from_cache()
-            featured_ids = [
-                a.id for a in featured_map.values() if a and hasattr(a, "id")
-            ]
+            featured = [a for a in featured_map.values() if a and hasattr(a, "id")]
         except Exception:
-            featured_ids = []
-
-        # Check if we have active filters
-        search = request.GET.get("search", "").strip()
-        category_param = request.GET.get("categories", "").strip()
-        sort = request.GET.get("sort", "recent")
+            featured = []
+        featured_ids = [a.id for a in featured]
 
         # Only exclude featured articles if no search/filter/sort is active
         # The prompt says: "si on search oubien on filtre, ou les trie il faut prendre en compte de featured article"
         # which can be interpreted as: "if we search/filter/sort, INCLUDE them. If default list, EXCLUDE them."
         # However, "recent" is the default sort.
-        is_default_view = not search and not category_param and sort == "recent"
+        is_default_view = not search and not category_ids and sort == "recent"
 
         if is_default_view and featured_ids:
             qs = qs.exclude(id__in=featured_ids)
 
-        # Search
+        # Search: prefix full-text match served by the search_vector GIN index
         if search:
-            qs = qs.filter(Q(title__icontains=search) | Q(summary__icontains=search))
-
-        # Category filter
-        if category_param:
-            category_ids = [
-                cid.strip() for cid in category_param.split(",") if cid.strip()
-            ]
-            if category_ids:
-                qs = qs.filter(categories__id__in=category_ids).distinct()
+            query = Article.build_search_query(search)
+            qs = qs.filter(search_vector=query) if query else qs.none()
+
+        if category_ids:
+            # EXISTS avoids the join fan-out and the DISTINCT sort; it is served
+            # by the join table's unique (article_id, category_id) index
+            qs = qs.filter(
+                Exists(
+                    Article.categories.through.objects.filter(
+                        article_id=OuterRef("pk"), category_id__in=category_ids
+                    )
+                )
+            )
 
         # Sort
-        if sort == "oldest":
-            qs = qs.order_by("published_at", "created_at")
-        elif sort == "popular":
+        if sort == "popular":
+            keyset_ordering = None
             qs = qs.order_by("-reading_time_minutes", "-published_at")
         else:
-            qs = qs.order_by("-published_at", "-created_at")
-
-        # Pagination
-        total_count = qs.count()
-        total_pages = max(1, math.ceil(total_count / self.ARTICLES_PER_PAGE))
-
-        try:
-            page = int(request.GET.get("page", 1))
-        except (ValueError, TypeError):
-            page = 1
+            keyset_ordering = self.KEYSET_ORDERINGS.get(
+                sort, self.KEYSET_ORDERINGS["recent"]
+            )
+            qs = qs.order_by(*keyset_ordering)
+
+        # Pagination: unfiltered listings reuse the cached published count;
+        # filtered ones count at most MAX_COUNTED_RESULTS rows, then switch
+        # to the planner estimate so wide matches stay constant-cost.
+        total_count_capped = False
+        count_is_estimate = False
+        if search or category_ids:
+            total_count = qs[: self.MAX_COUNTED_RESULTS].count()
+            total_count_capped = total_count >= self.MAX_COUNTED_RESULTS
+            if total_count_capped:
+                estimate = DbFunctions.estimated_count(qs)
+                if estimate > total_count:
+                    total_count = estimate
+                    count_is_estimate = True
+        else:
+            total_count = Article.get_published_count_from_cache()
+            if is_default_view:
+                total_count -= sum(
+                    1 for a in featured if a.status == ArticleStatus.PUBLISHED
+                )
+            total_count = max(0, total_count)
+        if total_count == 0:
+            # Nothing to page through: skip the row query entirely
+            return {
+                "articles": [],
+                "pagination": self._pagination(1, 1, 0, total_count_capped),
+            }
+        total_pages = (total_count + self.ARTICLES_PER_PAGE - 1) // self.ARTICLES_PER_PAGE
         page = max(1, min(page, total_pages))
 
-        start = (page - 1) * self.ARTICLES_PER_PAGE
-        end = start + self.ARTICLES_PER_PAGE
-        articles = qs[start:end]
-
-        return JsonResponse(
-            {
-                "articles": [_serialize_article(a) for a in articles],
-                "pagination": {
-                    "current_page": page,
-                    "total_pages": total_pages,
-                    "total_count": total_count,
-                    "per_page": self.ARTICLES_PER_PAGE,
-                    "has_previous": page > 1,
-                    "has_next": page < total_pages,
-                },
+        cursor = _decode_cursor(cursor_param)
+        if keyset_ordering and cursor:
+            # Keyset: constant-cost index range scan regardless of depth
+            cur_published_at, cur_id = cursor
+            descending = keyset_ordering[0].descending
+            if cur_published_at is None:
+                # Undated rows lead "recent" and end "oldest"
+                if descending:
+                    after = Q(published_at__isnull=True, id__lt=cur_id) | Q(
+                        published_at__isnull=False
+                    )
+                else:
+                    after = Q(published_at__isnull=True, id__gt=cur_id)
+            elif descending:
+                after = Q(published_at__lt=cur_published_at) | Q(
+                    published_at=cur_published_at, id__lt=cur_id
+                )
+            else:
+                after = (
+                    Q(published_at__gt=cur_published_at)
+                    | Q(published_at=cur_published_at, id__gt=cur_id)
+                    | Q(published_at__isnull=True)
+                )
+            qs = qs.filter(after)
+            start = 0
+        else:
+            start = (page - 1) * self.ARTICLES_PER_PAGE
+
+        # Fetch one extra row to detect whether another page follows
+        end = start + self.ARTICLES_PER_PAGE + 1
+        if start:
+            # Deep OFFSET pages: walk the narrow index for the page's ids first,
+            # then read the listed columns for just those rows
+            ids = list(qs.values_list("pk", flat=True)[start:end])
+            by_id = {
+                row["id"]: row
+                for row in Article.objects.filter(pk__in=ids).values(*ARTICLE_LIST_FIELDS)
             }
-        )
+            rows = [by_id[pk] for pk in ids if pk in by_id]
+        else:
+            rows = list(qs.values(*ARTICLE_LIST_FIELDS)[start:end])
+        has_next = len(rows) > self.ARTICLES_PER_PAGE
+        rows = rows[: self.ARTICLES_PER_PAGE]
+
+        next_cursor = None
+        if keyset_ordering and has_next:
+            next_cursor = _encode_cursor(rows[-1]["published_at"], rows[-1]["id"])
+
+        return {
+            "articles": _serialize_article_rows(rows),
+            "pagination": self._pagination(
+                page,
+                total_pages,
+                total_count,
+                total_count_capped,
+                count_is_estimate=count_is_estimate,
+                has_next=has_next,
+                next_cursor=next_cursor,
+            ),
+        }
+
+    def _pagination(
+        self,
+        page,
+        total_pages,
+        total_count,
+        total_count_capped,
+        count_is_estimate=False,
+        has_next=False,
+        next_cursor=None,
+    ):
+        """Build the ``pagination`` block of the response."""
+        return {
+            "current_page": page,
+            "total_pages": total_pages,
+            "total_count": total_count,
+            "total_count_capped": total_count_capped,
+            "count_is_estimate": count_is_estimate,
+            "per_page": self.ARTICLES_PER_PAGE,
+            "has_previous": page > 1,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        }
 
 
 class FeaturedArticlesApiView(View):
@@ -381,7 +609,7 @@ class FeaturedArticlesApiView(View):
             if article and getattr(article, "status", None) == ArticleStatus.PUBLISHED:
                 result.append(_serialize_article(article, fields=featured_fields))
 
-        return JsonResponse({"featured": result})
+        return orjson_response({"featured": result})
 
 
 class RelatedArticlesApiView(View):
@@ -390,15 +618,6 @@ class RelatedArticlesApiView(View):
     http_method_names = ["get"]
 
     def get(self, request):
-        related_fields = {
-            "id",
-            "title",
-            "slug",
-            "summary",
-            "reading_time_minutes",
-            "categories",
-        }
-
         # Get featured to exclude
         try:
             featured_map = FeaturedArticles.get_featured_articles_from_cache()
@@ -406,14 +625,13 @@ class RelatedArticlesApiView(View):
         except Exception:
             featured_ids = []
 
-        articles = (
+        rows = list(
             Article.objects.filter(status=ArticleStatus.PUBLISHED)
             .exclude(id__in=featured_ids)
-            .prefetch_related("categories")
-            .order_by("-published_at", "-created_at")[:4]
+            .order_by("-published_at", "-created_at")
+            .values(*RELATED_ARTICLE_FIELDS)[:4]
         )
-        result = [_serialize_article(a, fields=related_fields) for a in articles]
-        return JsonResponse({"related": result})
+        return orjson_response({"related": _serialize_article_rows(rows)})
 
 
 class CategoriesApiView(View):
@@ -421,12 +639,14 @@ class CategoriesApiView(View):
 
     http_method_names = ["get"]
 
-    def get(self, request):
-        categories = Category.objects.filter(is_active=True).order_by(
-            "sort_order", "name"
+    @method_decorator(
+        condition(
+            etag_func=lambda request: Category.get_active_api_payload_from_cache()["etag"]
         )
-        result = [{"id": str(c.id), "name": c.name, "slug": c.slug} for c in categories]
-        return JsonResponse({"categories": result})
+    )
+    def get(self, request):
+        payload = Category.get_active_api_payload_from_cache()
+        return HttpResponse(payload["body"], content_type="application/json")
 
 
 # ============================================================================
@@ -449,11 +669,9 @@ class ArticleClapApiView(View):
         except Article.DoesNotExist:
             return JsonResponse({"error": "Article not found"}, status=404)
 
-        # Get or create clap record
+        # Record the clap in one upsert (capped per reader)
         if request.user.is_authenticated:
-            clap, created = Clap.objects.get_or_create(
-                article=article, user=request.user, defaults={"count": 1}
-            )
+            count, created = Clap.bump(article.pk, user_id=request.user.pk)
         else:
             # Use session key for anonymous users
             session_key = request.session.session_key
@@ -461,28 +679,23 @@ class ArticleClapApiView(View):
                 request.session.create()
                 session_key = request.session.session_key
 
-            clap, created = Clap.objects.get_or_create(
-                article=article, session_key=session_key, defaults={"count": 1}
-            )
+            count, created = Clap.bump(article.pk, session_key=session_key)
 
-        # Increment count (max 50)
-        if not created and clap.count < 50:
-            clap.count += 1
-            clap.save()
-        elif not created and clap.count >= 50:
+        if count is None:
             return JsonResponse(
                 {
-                    "error": "Maximum claps reached (50)",
-                    "count": clap.count,
-                    "total": Clap.objects.filter(article=article).count(),
+                    "error": f"Maximum claps reached ({Clap.MAX_PER_READER})",
+                    "count": Clap.MAX_PER_READER,
+                    "total": article.claps_count,
                 },
                 status=400,
             )
 
-        # Return total clap count for this article
-        total_claps = Clap.objects.filter(article=article).count()
+        # Return total clap count for this article; a new clapper was just
+        # counted by Clap.bump, after `article` was loaded
+        total_claps = article.claps_count + (1 if created else 0)
         return JsonResponse(
-            {"success": True, "count": clap.count, "total": total_claps}
+            {"success": True, "count": count, "total": total_claps}
         )
 
 
@@ -512,8 +725,8 @@ class ArticleLikeApiView(LoginRequiredMixin, View):
             # Liked
             liked = True
 
-        # Return total like count
-        total_likes = Like.objects.filter(article=article).count()
+        # Return total like count, including the toggle just counted by the signals
+        total_likes = max(article.likes_count + (1 if liked else -1), 0)
         return JsonResponse({"success": True, "liked": liked, "total": total_likes})
 
 
@@ -571,8 +784,6 @@ class ArticleCommentApiView(LoginRequiredMixin, View):
             return JsonResponse({"error": "Article not found"}, status=404)
 
         # Get comment content from request
-        import json
-
         try:
             data = json.loads(request.body)
             content = data.get("content", "").strip()
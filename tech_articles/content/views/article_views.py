@@ -21,6 +21,7 @@ from django.views.generic import (
 )
 
 from tech_articles.content.forms import (
+    ArticleSetupForm,
     ArticleDetailsForm,
     ArticleSEOForm,
     ArticlePricingForm,
@@ -46,7 +47,7 @@ class ArticleListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        queryset = super().get_queryset().prefetch_related("categories")
+        queryset = super().get_queryset().for_list().prefetch_related("categories")
         search = self.request.GET.get("search", "").strip()
         status = self.request.GET.get("status", "")
         language = self.request.GET.get("language", "")
@@ -351,8 +352,6 @@ class ArticleCreateFullView(LoginRequiredMixin, AdminRequiredMixin, CreateView):
     template_name = "tech-articles/dashboard/pages/content/articles/create_full.html"
 
     def get_form_class(self):
-        from tech_articles.content.forms import ArticleSetupForm
-
         return ArticleSetupForm
 
     def form_valid(self, form):
@@ -6,7 +6,7 @@ from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _, gettext
 from django.views import View
 from django.views.generic import ListView
-from tech_articles.content.forms import CourseForm
+from tech_articles.content.forms import CourseForm, CourseTagForm
 from tech_articles.content.models import Course, CourseTag
 from tech_articles.utils.mixins import AdminRequiredMixin
 
@@ -114,14 +114,12 @@ class CourseTagDashboardListView(LoginRequiredMixin, AdminRequiredMixin, ListVie
         context = super().get_context_data(**kwargs)
         context["search"] = self.request.GET.get("search", "")
         context["total_count"] = CourseTag.objects.count()
-        from tech_articles.content.forms import CourseTagForm
         context["form"] = CourseTagForm()
         return context
 
 class CourseTagCreateAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
     """API view to create a new course tag via AJAX."""
     def post(self, request):
-        from tech_articles.content.forms import CourseTagForm
         form = CourseTagForm(request.POST)
         if form.is_valid():
             tag = form.save()
@@ -139,7 +137,6 @@ class CourseTagCreateAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
 class CourseTagUpdateAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
     """API view to update an existing course tag via AJAX."""
     def post(self, request, pk):
-        from tech_articles.content.forms import CourseTagForm
         tag = get_object_or_404(CourseTag, pk=pk)
         form = CourseTagForm(request.POST, instance=tag)
         if form.is_valid():
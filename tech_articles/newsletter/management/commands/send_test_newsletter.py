@@ -129,7 +129,6 @@ class Command(BaseCommand):
         from datetime import timedelta
 
         from django.conf import settings
-        from django.db.models import Count
         from django.utils.translation import gettext as _
 
         from tech_articles.content.models import Article
@@ -144,11 +143,7 @@ class Command(BaseCommand):
                 published_at__gte=week_ago,
             )
             .prefetch_related("categories")
-            .annotate(
-                like_count=Count("likes", distinct=True),
-                clap_count=Count("claps", distinct=True),
-            )
-            .order_by("-like_count", "-clap_count", "-published_at")[:3]
+            .order_by("-likes_count", "-claps_count", "-published_at")[:3]
         )
 
         if not articles_qs:
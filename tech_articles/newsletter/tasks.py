@@ -273,7 +273,6 @@ def send_digest_newsletter(self):
     Idempotent: based on a fixed lookback window.
     Runs every 5 days at 05:00 America/Toronto via Celery Beat.
     """
-    from django.db.models import Count
     from django.utils import translation as _translation
     from tech_articles.content.models import Article
     from tech_articles.newsletter.models import NewsletterSubscriber
@@ -291,11 +290,7 @@ def send_digest_newsletter(self):
             published_at__gte=week_ago,
         )
         .prefetch_related("categories")
-        .annotate(
-            like_count=Count("likes", distinct=True),
-            clap_count=Count("claps", distinct=True),
-        )
-        .order_by("-like_count", "-clap_count", "-published_at")[:3]
+        .order_by("-likes_count", "-claps_count", "-published_at")[:3]
     )
 
     if not articles:
@@ -26,6 +26,8 @@ class ArticlesListingManager {
         this.config = config;
         this.currentPage = 1;
         this.totalPages = 1;
+        this.nextCursor = null;
+        this.pendingCursor = null;
         this.searchTimeout = null;
         this.defaultSort = 'recent';
         this.selectedSort = this.defaultSort;
@@ -368,6 +370,12 @@ class ArticlesListingManager {
         params.set('page', this.currentPage);
         params.set('sort', this.selectedSort);
 
+        // Keyset cursor is only valid for the page right after the current one
+        if (this.pendingCursor) {
+            params.set('cursor', this.pendingCursor);
+            this.pendingCursor = null;
+        }
+
         const searchVal = this.searchInput ? this.searchInput.value.trim() : '';
         // Only include the search parameter when the query has at least 3 characters
         if (searchVal && searchVal.length >= 3) {
@@ -392,6 +400,7 @@ class ArticlesListingManager {
 
         this.totalPages = data.pagination.total_pages;
         this.currentPage = data.pagination.current_page;
+        this.nextCursor = data.pagination.next_cursor || null;
 
         if (!this.articlesGrid) return;
 
@@ -519,6 +528,7 @@ class ArticlesListingManager {
             btn.addEventListener('click', (e) => {
                 const page = parseInt(e.currentTarget.dataset.page, 10);
                 if (!isNaN(page) && page >= 1 && page <= this.totalPages) {
+                    this.pendingCursor = page === this.currentPage + 1 ? this.nextCursor : null;
                     this.currentPage = page;
                     this.loadArticles();
                     this.articlesGrid.scrollIntoView({behavior: 'smooth', block: 'start'});
@@ -1,8 +1,10 @@
+import json
 import logging
 import secrets
 import string
 from typing import Any, Optional
 
+from django.db import DatabaseError, connections, transaction
 from django.utils.text import slugify
 
 logger = logging.getLogger(__name__)
@@ -13,6 +15,8 @@ class DbFunctions:
 
     RANDOM_SUFFIX_LENGTH = 4
     RANDOM_CHARS = string.ascii_lowercase + string.digits
+    # Models whose save() does nothing bulk_create would skip besides the slug
+    BULK_SLUG_MODELS = frozenset({"content.Category", "content.Tag"})
 
     @staticmethod
     def random_string_generator(size: int = RANDOM_SUFFIX_LENGTH, chars: str = RANDOM_CHARS) -> str:
@@ -34,6 +38,7 @@ class DbFunctions:
         field_value: str,
         new_slug: Optional[str] = None,
         max_attempts: int = 100,
+        known_slugs: Optional[set[str]] = None,
     ) -> str:
         """
         Generate a unique slug for a given instance based on the provided field value.
@@ -43,6 +48,9 @@ class DbFunctions:
             field_value: The string value to slugify.
             new_slug: Optional pre-generated slug (used internally for recursion).
             max_attempts: Maximum number of attempts to find a unique slug (prevents infinite loops).
+            known_slugs: Optional set of slugs already taken. When given, it is checked
+                instead of the database and the returned slug is added to it, so a loop
+                over many instances needs no per-row query.
 
         Returns:
             A unique slug string.
@@ -66,9 +74,14 @@ class DbFunctions:
         slug = slug[:max_length]
 
         # Check if slug already exists
-        qs_exists = klass.objects.filter(slug=slug).exists()
+        if known_slugs is not None:
+            qs_exists = slug in known_slugs
+        else:
+            qs_exists = klass.objects.filter(slug=slug).exists()
 
         if not qs_exists:
+            if known_slugs is not None:
+                known_slugs.add(slug)
             logger.info(f"✅ Unique slug generated: {slug}")
             return slug
 
@@ -91,6 +104,7 @@ class DbFunctions:
             field_value,
             new_slug=new_slug_candidate,
             max_attempts=max_attempts,
+            known_slugs=known_slugs,
         )
 
     @staticmethod
@@ -100,6 +114,7 @@ class DbFunctions:
         related_field_name: str,
         new_slug: Optional[str] = None,
         max_attempts: int = 1000,
+        known_slugs: Optional[set[str]] = None,
     ) -> str:
         """
         Generate a unique slug for an instance where the slug must be unique relative to a related object.
@@ -112,6 +127,9 @@ class DbFunctions:
             related_field_name: The name of the ForeignKey field linking to the parent (e.g., 'article').
             new_slug: Optional pre-generated slug (used internally for recursion).
             max_attempts: Maximum number of attempts to find a unique slug (prevents infinite loops).
+            known_slugs: Optional set of slugs already taken under the same related object.
+                When given, it is checked instead of the database and the returned slug
+                is added to it.
 
         Returns:
             A unique slug string (unique per related object).
@@ -156,13 +174,18 @@ class DbFunctions:
         slug = slug[:max_length]
 
         # Check if slug already exists for THIS related object
-        filter_kwargs = {
-            'slug': slug,
-            related_field_name: related_instance,
-        }
-        qs_exists = klass.objects.filter(**filter_kwargs).exists()
+        if known_slugs is not None:
+            qs_exists = slug in known_slugs
+        else:
+            filter_kwargs = {
+                'slug': slug,
+                related_field_name: related_instance,
+            }
+            qs_exists = klass.objects.filter(**filter_kwargs).exists()
 
         if not qs_exists:
+            if known_slugs is not None:
+                known_slugs.add(slug)
             logger.info(f"✅ Unique slug generated (relative to {related_field_name}): {slug}")
             return slug
 
@@ -185,6 +208,7 @@ class DbFunctions:
             related_field_name,
             new_slug=new_slug_candidate,
             max_attempts=max_attempts,
+            known_slugs=known_slugs,
         )
 
     @staticmethod
@@ -209,3 +233,76 @@ class DbFunctions:
             raise AttributeError(f"Instance {instance.__class__.__name__} must have a 'title' attribute")
 
         return DbFunctions.generate_unique_slug(instance, instance.title, new_slug=new_slug)
+
+    @staticmethod
+    def bulk_create_with_slugs(
+        objs: list[Any],
+        source_field: str = 'name',
+        batch_size: int = 1000,
+    ) -> list[Any]:
+        """
+        Bulk insert instances of a model with a globally unique ``slug`` field.
+
+        Existing slugs are read once into a set, and missing slugs are
+        generated against it, so an import costs one SELECT plus the batched
+        INSERTs instead of a uniqueness query per row. Like ``bulk_create``,
+        this bypasses ``save()`` and the ``post_save`` signals, so it is
+        limited to ``BULK_SLUG_MODELS``: articles would miss their search
+        document and cover image URL. Callers clear any caches the skipped
+        signals would have.
+
+        Args:
+            objs: Unsaved instances of a single model.
+            source_field: Attribute slugified for instances without a slug.
+            batch_size: Rows per INSERT statement.
+
+        Returns:
+            The created instances.
+
+        Raises:
+            ValueError: If the instances are not of a model in ``BULK_SLUG_MODELS``.
+        """
+        if not objs:
+            return []
+        klass = objs[0].__class__
+        if klass._meta.label not in DbFunctions.BULK_SLUG_MODELS:
+            raise ValueError(f"bulk_create_with_slugs does not support {klass._meta.label}")
+        known_slugs = set(klass.objects.values_list('slug', flat=True))
+        for obj in objs:
+            if obj.slug:
+                known_slugs.add(obj.slug)
+            else:
+                obj.slug = DbFunctions.generate_unique_slug(
+                    obj, getattr(obj, source_field), known_slugs=known_slugs
+                )
+        return klass.objects.bulk_create(objs, batch_size=batch_size)
+
+    @staticmethod
+    def estimated_count(queryset: Any) -> int:
+        """
+        Return the planner's row estimate for a queryset without running it.
+
+        Uses ``EXPLAIN (FORMAT JSON)`` on PostgreSQL, so the cost does not grow
+        with the number of matching rows. The figure is only as good as the
+        table statistics and must not be used where an exact count matters.
+
+        Args:
+            queryset: The QuerySet to estimate.
+
+        Returns:
+            The estimated number of rows, or 0 if no estimate is available.
+        """
+        sql, params = queryset.order_by().query.sql_with_params()
+        try:
+            # Savepoint, so a failed EXPLAIN does not abort the caller's
+            # transaction (requests run in one under ATOMIC_REQUESTS)
+            with transaction.atomic(using=queryset.db):
+                with connections[queryset.db].cursor() as cursor:
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                    plan = cursor.fetchone()[0]
+        except DatabaseError as exc:
+            logger.warning("Could not estimate row count: %s", exc)
+            return 0
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
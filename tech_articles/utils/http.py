@@ -0,0 +1,24 @@
+"""
+HTTP helpers shared by the JSON API views.
+"""
+from typing import Any
+
+import orjson
+from django.http import HttpResponse
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to JSON bytes with orjson.
+
+    UUIDs and datetimes are encoded natively, so callers can pass model
+    values straight through without converting them to strings first.
+    """
+    return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+
+def orjson_response(data: Any, status: int = 200) -> HttpResponse:
+    """Return an ``application/json`` response serialized with orjson."""
+    return HttpResponse(dumps_json(data), status=status, content_type="application/json")
@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from tech_articles.content.models import Article, Category
+from tech_articles.utils.db_functions import DbFunctions
+
+
+class EstimatedCountTest(TestCase):
+    """Test cases for DbFunctions.estimated_count."""
+
+    def test_failed_explain_leaves_transaction_usable(self):
+        broken = Article.objects.extra(where=["no_such_column = 1"])
+        self.assertEqual(DbFunctions.estimated_count(broken), 0)
+        # The surrounding transaction can still run queries
+        self.assertEqual(Article.objects.count(), 0)
+
+
+class BulkCreateWithSlugsTest(TestCase):
+    """Test cases for DbFunctions.bulk_create_with_slugs."""
+
+    def test_slugs_deduplicated_without_per_row_queries(self):
+        Category.objects.create(name="Python")
+        objs = [Category(name="Python!"), Category(name="Python?"), Category(name="Django")]
+        # One SELECT for the existing slugs, one INSERT
+        with self.assertNumQueries(2):
+            DbFunctions.bulk_create_with_slugs(objs)
+
+        slugs = list(Category.objects.values_list("slug", flat=True))
+        self.assertEqual(len(slugs), 4)
+        self.assertEqual(len(set(slugs)), 4)
+        self.assertIn("django", slugs)
+
+    def test_articles_are_rejected(self):
+        with self.assertRaises(ValueError):
+            DbFunctions.bulk_create_with_slugs([Article(title="Imported")], source_field="title")